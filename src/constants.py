@@ -23,6 +23,7 @@ SLEEPER_PLAYERS_URL = f'{SLEEPER_API_BASE_URL}/players/nfl'
 
 # Application constants
 GOAT = 7  # Tom Brady's Super Bowl rings (used for confirmation)
+ALL_TIME_HIGH_SCORES_COUNT = 10  # Rows in the all-time team/player high score CSVs
 
 # Data directory paths
 DATA_DIR = 'src/data'
@@ -9,6 +9,7 @@ from constants import (
     MUNGED_DIR,
     UNMUNGED_DIR
 )
+from utils.json_utils import load_json_cached
 from utils.logging_utils import get_logger
 from utils.validation import validate_path, validate_dict, validate_season_year
 
@@ -22,6 +23,7 @@ from mappers import (
 from standings import (
     calculate_weekly_standings,
     calculate_weekly_standings_dict,
+    clear_standings_cache,
     standings_to_list
 )
 from recap import (
@@ -148,6 +150,9 @@ def process_season(year: str, unmunged_dir: Path, munged_dir: Path) -> None:
     
     validate_path(season_unmunged, must_exist=True, must_be_dir=True)
     
+    # Raw data may have been re-fetched since standings were last memoized
+    clear_standings_cache()
+    
     # Create output directories
     regular_season_dir = season_munged / "regular_season"
     postseason_dir = season_munged / "postseason"
@@ -205,14 +210,9 @@ def process_season(year: str, unmunged_dir: Path, munged_dir: Path) -> None:
         
         logger.info(f"  Processing week {week}...")
         
-        # Load week data
-        with open(matchups_path, 'r') as f:
-            matchups = json.load(f)
-        
-        transactions = []
-        if transactions_path.exists():
-            with open(transactions_path, 'r') as f:
-                transactions = json.load(f)
+        # Load week data (cached: the standings calculation reads the same files)
+        matchups = load_json_cached(matchups_path)
+        transactions = load_json_cached(transactions_path) or []
         
         # Calculate standings up to this week (incrementally using cache)
         cached_standings = calculate_weekly_standings_dict(
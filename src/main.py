@@ -4,12 +4,15 @@ from pathlib import Path
 from api_calls import get_all_seasons, curr_leagueid, call_api, save_json_to_file
 from data_processor import process_season
 from stats import (
+    collect_all_season_data,
+    collect_high_scores,
     generate_all_time_standings_csv,
     generate_head_to_head_csv,
     generate_weekly_high_scores_csv,
     generate_player_high_scores_csv
 )
-from constants import GOAT, MUNGED_DIR, UNMUNGED_DIR
+from constants import ALL_TIME_HIGH_SCORES_COUNT, GOAT, MUNGED_DIR, UNMUNGED_DIR
+from utils.file_utils import get_season_directories
 
 def confirm_action() -> bool:
     """
@@ -67,11 +70,7 @@ def process_data():
     if not unmunged_dir.exists():
         return print(f"Error: {unmunged_dir} directory not found")
     
-    available_seasons = sorted(
-        [item.name for item in unmunged_dir.iterdir()
-         if item.is_dir() and item.name.isdigit() and (item / "league_info.json").exists()],
-        reverse=True
-    )
+    available_seasons = [season_dir.name for season_dir in get_season_directories(unmunged_dir)]
     if not available_seasons:
         return print("No seasons found in unmunged directory")
     
@@ -128,13 +127,17 @@ def generate_standings():
         return print(f"Error: {munged_dir} directory not found")
     
     try:
-        generate_all_time_standings_csv(unmunged_dir, standings_path)
+        # Walk the seasons once and share the collection between both CSVs
+        season_data = collect_all_season_data(unmunged_dir)
+        generate_all_time_standings_csv(unmunged_dir, standings_path, season_data)
         print(f"\nStandings CSV generated at {standings_path}")
-        generate_head_to_head_csv(unmunged_dir, h2h_path)
+        generate_head_to_head_csv(unmunged_dir, h2h_path, season_data)
         print(f"Head-to-head CSV generated at {h2h_path}")
-        generate_weekly_high_scores_csv(munged_dir, weekly_high_scores_path)
+        # Read each recap once for both the team and player high scores
+        weekly_scores, player_scores = collect_high_scores(munged_dir, ALL_TIME_HIGH_SCORES_COUNT)
+        generate_weekly_high_scores_csv(munged_dir, weekly_high_scores_path, weekly_scores)
         print(f"Weekly high scores CSV generated at {weekly_high_scores_path}")
-        generate_player_high_scores_csv(munged_dir, player_high_scores_path)
+        generate_player_high_scores_csv(munged_dir, player_high_scores_path, player_scores)
         print(f"Player high scores CSV generated at {player_high_scores_path}")
     except Exception as e:
         print(f"\nError generating standings: {e}")
@@ -143,7 +146,8 @@ def generate_html_reports():
     print("\n[5] Generating HTML reports...")
     try:
         from reports.generator import generate_all_reports
-        generate_all_reports()
+        # Pass --force on the command line to re-render reports that are already up to date
+        generate_all_reports(force='--force' in sys.argv)
         print("\nHTML reports generated successfully!")
         from constants import REPORTS_DIR
         print(f"Reports are available in: {REPORTS_DIR}")
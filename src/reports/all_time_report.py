@@ -1,24 +1,36 @@
 """Generate HTML reports for all-time statistics."""
 import csv
+import os
+from itertools import islice
 from pathlib import Path
 from typing import List
 
-from .html_generator import escape_html
-from .templates import get_html_template, get_navigation, get_breadcrumb
+from .html_generator import escape_html, _escape_str
+from .templates import RENDER_SOURCES, iter_html_template, get_navigation, get_breadcrumb
+from utils.file_utils import is_up_to_date, write_text_atomic
 
+# (csv file name, html file name, report type) for each all-time report
+_ALL_TIME_REPORTS = (
+    ('standings.csv', 'standings.html', 'standings'),
+    ('head_to_head.csv', 'head_to_head.html', 'head_to_head'),
+    ('weekly_high_scores.csv', 'weekly_high_scores.html', 'weekly_high_scores'),
+    ('player_high_scores.csv', 'player_high_scores.html', 'player_high_scores'),
+)
 
-def csv_to_html_table(csv_path: Path, max_rows: int = None) -> str:
+
+def csv_to_html_table(csv_path: Path, max_rows: int = None, _exists: bool = False) -> str:
     """
     Convert CSV file to HTML table.
     
     Args:
         csv_path: Path to CSV file
         max_rows: Maximum number of rows to display (None for all)
+        _exists: Caller has already confirmed csv_path exists, skip the check
         
     Returns:
         HTML table string
     """
-    if not csv_path.exists():
+    if not _exists and not csv_path.exists():
         return '<p>Data file not found.</p>'
     
     html = ['<table>']
@@ -29,24 +41,17 @@ def csv_to_html_table(csv_path: Path, max_rows: int = None) -> str:
             header = next(reader, None)
             
             if header:
-                html.append('<thead><tr>')
-                for col in header:
-                    # Remove # prefix if present
-                    col_name = col.lstrip('#')
-                    html.append(f'<th>{escape_html(col_name)}</th>')
-                html.append('</tr></thead>')
+                # Remove # prefix if present
+                header_cells = '</th><th>'.join(_escape_str(col.lstrip('#')) for col in header)
+                html.append(f'<thead><tr><th>{header_cells}</th></tr></thead>')
                 html.append('<tbody>')
                 
-                row_count = 0
-                for row in reader:
-                    if max_rows and row_count >= max_rows:
-                        break
-                    
-                    html.append('<tr>')
-                    for cell in row:
-                        html.append(f'<td>{escape_html(cell)}</td>')
-                    html.append('</tr>')
-                    row_count += 1
+                # One join per row instead of one append per cell
+                rows = islice(reader, max_rows) if max_rows else reader
+                html.extend(
+                    f'<tr><td>{"</td><td>".join(map(_escape_str, row))}</td></tr>' if row else '<tr></tr>'
+                    for row in rows
+                )
                 
                 html.append('</tbody>')
     except Exception as e:
@@ -60,7 +65,8 @@ def generate_all_time_html(
     csv_path: Path,
     output_path: Path,
     report_type: str,
-    title: str = None
+    title: str = None,
+    _exists: bool = False
 ) -> None:
     """
     Generate HTML page for all-time statistics.
@@ -70,6 +76,7 @@ def generate_all_time_html(
         output_path: Path to output HTML file
         report_type: Type of report (e.g., 'standings', 'head_to_head', etc.)
         title: Custom title (if None, will be generated from report_type)
+        _exists: Caller has already confirmed csv_path exists
     """
     if title is None:
         title_map = {
@@ -91,67 +98,38 @@ def generate_all_time_html(
     content_parts.append(f'<h1>{title}</h1>')
     
     # Generate table from CSV
-    table_html = csv_to_html_table(csv_path)
+    table_html = csv_to_html_table(csv_path, _exists=_exists)
     content_parts.append(table_html)
     
-    content = ''.join(content_parts)
-    
-    # Generate full HTML
-    html = get_html_template(full_title, nav, content)
-    
-    # Write to file
+    # Write the cached page chrome and content pieces without joining them first
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    write_text_atomic(output_path, iter_html_template(full_title, nav, content_parts))
 
 
-def generate_all_all_time_reports(munged_dir: Path, reports_dir: Path) -> None:
+def generate_all_all_time_reports(munged_dir: Path, reports_dir: Path, force: bool = False) -> None:
     """
     Generate all all-time statistics HTML reports.
     
     Args:
         munged_dir: Path to munged data directory
         reports_dir: Path to reports output directory
+        force: Regenerate reports even if they are newer than their CSV
     """
     all_time_dir = munged_dir / "all_time"
     all_time_reports_dir = reports_dir / "all_time"
     
-    if not all_time_dir.exists():
+    # List the directory once instead of probing each CSV path
+    try:
+        with os.scandir(all_time_dir) as entries:
+            present = {entry.name: Path(entry.path) for entry in entries if entry.is_file()}
+    except FileNotFoundError:
         return
     
-    # Standings
-    standings_csv = all_time_dir / "standings.csv"
-    if standings_csv.exists():
-        generate_all_time_html(
-            standings_csv,
-            all_time_reports_dir / "standings.html",
-            'standings'
-        )
-    
-    # Head-to-Head
-    h2h_csv = all_time_dir / "head_to_head.csv"
-    if h2h_csv.exists():
-        generate_all_time_html(
-            h2h_csv,
-            all_time_reports_dir / "head_to_head.html",
-            'head_to_head'
-        )
-    
-    # Weekly High Scores
-    weekly_high_csv = all_time_dir / "weekly_high_scores.csv"
-    if weekly_high_csv.exists():
-        generate_all_time_html(
-            weekly_high_csv,
-            all_time_reports_dir / "weekly_high_scores.html",
-            'weekly_high_scores'
-        )
-    
-    # Player High Scores
-    player_high_csv = all_time_dir / "player_high_scores.csv"
-    if player_high_csv.exists():
-        generate_all_time_html(
-            player_high_csv,
-            all_time_reports_dir / "player_high_scores.html",
-            'player_high_scores'
-        )
-
+    for csv_name, html_name, report_type in _ALL_TIME_REPORTS:
+        csv_path = present.get(csv_name)
+        if csv_path is None:
+            continue
+        
+        output_path = all_time_reports_dir / html_name
+        if force or not is_up_to_date(output_path, csv_path, *RENDER_SOURCES):
+            generate_all_time_html(csv_path, output_path, report_type, _exists=True)
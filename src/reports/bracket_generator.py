@@ -1,7 +1,37 @@
 """Generate visual bracket displays for postseason."""
 from typing import Dict, List, Optional
 
-from .html_generator import escape_html
+from .html_generator import _escape_str
+
+# Opening tag for every (team state, is final round) combination
+_TEAM_DIV = {
+    (state, is_final): f'<div class="bracket-team {state} {"bracket-final" if is_final else ""}">'
+    for state in ('winner', 'tbd', '')
+    for is_final in (True, False)
+}
+
+
+def _resolve_team_reference(team_from: Dict, matchup_map: Dict[int, Dict]) -> Optional[str]:
+    """
+    Resolve a t1_from/t2_from reference ({'w': id} or {'l': id}) to a team name.
+    
+    Args:
+        team_from: Reference to the winner or loser of another matchup
+        matchup_map: Map of matchup_id to matchup data
+        
+    Returns:
+        Team name string, or None if the referenced matchup is unknown
+    """
+    winner_ref = team_from.get('w')
+    if winner_ref is not None:
+        ref_matchup_id, name_key = winner_ref, 'winner_team_name'
+    else:
+        ref_matchup_id, name_key = team_from.get('l'), 'loser_team_name'
+    
+    ref_matchup = matchup_map.get(ref_matchup_id)
+    if not ref_matchup:
+        return None
+    return ref_matchup.get(name_key, 'TBD')
 
 
 def resolve_team_name(matchup: Dict, matchup_map: Dict[int, Dict], bracket: List[Dict]) -> str:
@@ -24,18 +54,18 @@ def resolve_team_name(matchup: Dict, matchup_map: Dict[int, Dict], bracket: List
     t1_from = matchup.get('t1_from', {})
     if t1_from:
         # Get winner or loser from referenced matchup
-        ref_matchup_id = t1_from.get('w') or t1_from.get('l')
-        if ref_matchup_id:
-            ref_matchup = matchup_map.get(ref_matchup_id)
-            if ref_matchup:
-                if 'w' in t1_from:
-                    return ref_matchup.get('winner_team_name', 'TBD')
-                else:
-                    return ref_matchup.get('loser_team_name', 'TBD')
+        ref_team_name = _resolve_team_reference(t1_from, matchup_map)
+        if ref_team_name is not None:
+            return ref_team_name
     
     return 'TBD'
 
 
+def _bracket_matchup_id(matchup: Dict) -> int:
+    """Sort key for bracket matchups; entries without an 'm' id sort first."""
+    return matchup.get('m', 0)
+
+
 def organize_bracket_by_round(bracket: List[Dict]) -> Dict[int, List[Dict]]:
     """
     Organize bracket matchups by round number.
@@ -47,7 +77,6 @@ def organize_bracket_by_round(bracket: List[Dict]) -> Dict[int, List[Dict]]:
         Dictionary mapping round number to list of matchups
     """
     rounds = {}
-    matchup_map = {m.get('m'): m for m in bracket if m.get('m')}
     
     for matchup in bracket:
         round_num = matchup.get('r')
@@ -58,7 +87,7 @@ def organize_bracket_by_round(bracket: List[Dict]) -> Dict[int, List[Dict]]:
     
     # Sort matchups within each round by matchup ID
     for round_num in rounds:
-        rounds[round_num].sort(key=lambda m: m.get('m', 0))
+        rounds[round_num].sort(key=_bracket_matchup_id)
     
     return rounds
 
@@ -87,6 +116,7 @@ def generate_visual_bracket(bracket: List[Dict], bracket_name: str = "Bracket")
     html = [f'<h2>{bracket_name}</h2>']
     html.append('<div class="bracket-container">')
     html.append('<div class="bracket-wrapper">')
+    html_append = html.append
     
     # Get max round number
     max_round = max(rounds.keys())
@@ -96,61 +126,56 @@ def generate_visual_bracket(bracket: List[Dict], bracket_name: str = "Bracket")
         round_matchups = rounds[round_num]
         is_final = round_num == max_round
         
-        html.append('<div class="bracket-round">')
+        html_append('<div class="bracket-round">')
         
         # Round label
         if is_final:
-            html.append('<div class="bracket-round-label">🏆 FINAL</div>')
+            html_append('<div class="bracket-round-label">🏆 FINAL</div>')
         else:
-            html.append(f'<div class="bracket-round-label">Round {round_num}</div>')
+            html_append(f'<div class="bracket-round-label">Round {round_num}</div>')
         
         # Generate matchups for this round
         for matchup in round_matchups:
-            html.append('<div class="bracket-matchup">')
+            get = matchup.get
+            html_append('<div class="bracket-matchup">')
             
             # Team 1
-            team1_name = matchup.get('t1_team_name', 'TBD')
+            team1_name = get('t1_team_name', 'TBD')
             if not team1_name or team1_name == 'Team None':
                 team1_name = resolve_team_name(matchup, matchup_map, bracket)
             
-            winner_name = matchup.get('winner_team_name', '')
+            winner_name = get('winner_team_name', '')
             is_winner1 = winner_name and team1_name == winner_name
             
             team1_class = 'winner' if is_winner1 else ('tbd' if team1_name == 'TBD' else '')
-            final_class = 'bracket-final' if is_final else ''
             
-            html.append(f'<div class="bracket-team {team1_class} {final_class}">')
-            html.append(escape_html(team1_name))
-            html.append('</div>')
+            html_append(_TEAM_DIV[team1_class, is_final])
+            html_append(_escape_str(team1_name))
+            html_append('</div>')
             
             # Team 2 (if exists)
-            team2_name = matchup.get('t2_team_name', 'TBD')
+            team2_name = get('t2_team_name', 'TBD')
             if not team2_name or team2_name == 'Team None':
-                t2_from = matchup.get('t2_from', {})
+                t2_from = get('t2_from', {})
                 if t2_from:
-                    ref_matchup_id = t2_from.get('w') or t2_from.get('l')
-                    if ref_matchup_id:
-                        ref_matchup = matchup_map.get(ref_matchup_id)
-                        if ref_matchup:
-                            if 'w' in t2_from:
-                                team2_name = ref_matchup.get('winner_team_name', 'TBD')
-                            else:
-                                team2_name = ref_matchup.get('loser_team_name', 'TBD')
+                    ref_team_name = _resolve_team_reference(t2_from, matchup_map)
+                    if ref_team_name is not None:
+                        team2_name = ref_team_name
             
             if team2_name and team2_name != 'Team None':
                 is_winner2 = winner_name and team2_name == winner_name
                 team2_class = 'winner' if is_winner2 else ('tbd' if team2_name == 'TBD' else '')
                 
-                html.append(f'<div class="bracket-team {team2_class} {final_class}">')
-                html.append(escape_html(team2_name))
-                html.append('</div>')
+                html_append(_TEAM_DIV[team2_class, is_final])
+                html_append(_escape_str(team2_name))
+                html_append('</div>')
             
-            html.append('</div>')  # End matchup
+            html_append('</div>')  # End matchup
         
-        html.append('</div>')  # End round
+        html_append('</div>')  # End round
     
-    html.append('</div>')  # End wrapper
-    html.append('</div>')  # End container
+    html_append('</div>')  # End wrapper
+    html_append('</div>')  # End container
     
     return ''.join(html)
 
@@ -178,14 +203,9 @@ def get_team_from_matchup(matchup: Dict, matchup_map: Dict[int, Dict], bracket:
         if not team_name or team_name == 'Team None':
             t2_from = matchup.get('t2_from', {})
             if t2_from:
-                ref_matchup_id = t2_from.get('w') or t2_from.get('l')
-                if ref_matchup_id:
-                    ref_matchup = matchup_map.get(ref_matchup_id)
-                    if ref_matchup:
-                        if 'w' in t2_from:
-                            team_name = ref_matchup.get('winner_team_name', 'TBD')
-                        else:
-                            team_name = ref_matchup.get('loser_team_name', 'TBD')
+                ref_team_name = _resolve_team_reference(t2_from, matchup_map)
+                if ref_team_name is not None:
+                    team_name = ref_team_name
         return team_name
 
 
@@ -212,6 +232,7 @@ def generate_simple_bracket(bracket: List[Dict], bracket_name: str = "Bracket")
     html = [f'<h2>{bracket_name}</h2>']
     html.append('<div class="bracket-container">')
     html.append('<div class="bracket-wrapper">')
+    html_append = html.append
     
     max_round = max(rounds.keys())
     
@@ -220,11 +241,11 @@ def generate_simple_bracket(bracket: List[Dict], bracket_name: str = "Bracket")
         round_matchups = rounds[round_num]
         is_final = round_num == max_round
         
-        html.append('<div class="bracket-round">')
-        html.append(f'<div class="bracket-round-label">{"🏆 FINAL" if is_final else f"Round {round_num}"}</div>')
+        html_append('<div class="bracket-round">')
+        html_append(f'<div class="bracket-round-label">{"🏆 FINAL" if is_final else f"Round {round_num}"}</div>')
         
         for matchup in round_matchups:
-            html.append('<div class="bracket-matchup">')
+            html_append('<div class="bracket-matchup">')
             
             # Team 1
             team1_name = get_team_from_matchup(matchup, matchup_map, bracket, is_team1=True)
@@ -232,11 +253,10 @@ def generate_simple_bracket(bracket: List[Dict], bracket_name: str = "Bracket")
             is_winner1 = winner_name and team1_name == winner_name
             
             team1_class = 'winner' if is_winner1 else ('tbd' if team1_name == 'TBD' else '')
-            final_class = 'bracket-final' if is_final else ''
             
-            html.append(f'<div class="bracket-team {team1_class} {final_class}">')
-            html.append(escape_html(team1_name))
-            html.append('</div>')
+            html_append(_TEAM_DIV[team1_class, is_final])
+            html_append(_escape_str(team1_name))
+            html_append('</div>')
             
             # Team 2 (if exists)
             team2_name = get_team_from_matchup(matchup, matchup_map, bracket, is_team1=False)
@@ -244,16 +264,16 @@ def generate_simple_bracket(bracket: List[Dict], bracket_name: str = "Bracket")
                 is_winner2 = winner_name and team2_name == winner_name
                 team2_class = 'winner' if is_winner2 else ('tbd' if team2_name == 'TBD' else '')
                 
-                html.append(f'<div class="bracket-team {team2_class} {final_class}">')
-                html.append(escape_html(team2_name))
-                html.append('</div>')
+                html_append(_TEAM_DIV[team2_class, is_final])
+                html_append(_escape_str(team2_name))
+                html_append('</div>')
             
-            html.append('</div>')  # End matchup
+            html_append('</div>')  # End matchup
         
-        html.append('</div>')  # End round
+        html_append('</div>')  # End round
     
-    html.append('</div>')  # End wrapper
-    html.append('</div>')  # End container
+    html_append('</div>')  # End wrapper
+    html_append('</div>')  # End container
     
     return ''.join(html)
 
@@ -2,7 +2,7 @@
 from pathlib import Path
 from typing import List, Optional
 
-from constants import MUNGED_DIR, REPORTS_DIR
+from constants import MUNGED_DIR, REPORTS_DIR, UNMUNGED_DIR
 from reports import (
     generate_weekly_html,
     generate_season_index,
@@ -10,15 +10,25 @@ from reports import (
     generate_all_all_time_reports
 )
 from reports.season_report import generate_postseason_html
+from reports.templates import RENDER_SOURCES
+from utils.file_utils import flush_reports_dir, get_week_numbers, is_up_to_date
 from utils.json_utils import load_json
 from utils.logging_utils import get_logger
 
 logger = get_logger('reports')
 
 
-def generate_all_reports() -> None:
+def generate_all_reports(force: bool = False) -> None:
     """
     Generate all HTML reports for all available seasons.
+    
+    Reports whose output file is newer than the data it is built from (and
+    than the report code in RENDER_SOURCES) are skipped, so incremental runs
+    only re-render pages whose inputs changed. A missing input counts as a
+    change.
+    
+    Args:
+        force: Regenerate every report even if it is already up to date
     """
     munged_dir = Path(MUNGED_DIR)
     reports_dir = Path(REPORTS_DIR)
@@ -30,64 +40,62 @@ def generate_all_reports() -> None:
     logger.info("Starting HTML report generation...")
     
     # Find all seasons
-    seasons = []
-    for item in munged_dir.iterdir():
-        if item.is_dir() and item.name.isdigit():
-            seasons.append(item.name)
+    seasons = sorted(
+        item.name for item in munged_dir.glob('[0-9]*')
+        if item.is_dir() and item.name.isdigit()
+    )
     
     if not seasons:
         logger.warning("No seasons found in munged directory")
         return
     
-    logger.info(f"Found {len(seasons)} season(s): {', '.join(sorted(seasons))}")
+    logger.info(f"Found {len(seasons)} season(s): {', '.join(seasons)}")
     
     # Generate all-time reports
     logger.info("Generating all-time statistics reports...")
-    generate_all_all_time_reports(munged_dir, reports_dir)
+    generate_all_all_time_reports(munged_dir, reports_dir, force=force)
     
     # Generate reports for each season
-    for season in sorted(seasons):
+    for season in seasons:
         logger.info(f"Generating reports for {season} season...")
         season_munged = munged_dir / season
         season_reports = reports_dir / season
         
         # Find all weeks
         regular_season_dir = season_munged / "regular_season"
-        weeks = []
-        if regular_season_dir.exists():
-            for item in regular_season_dir.iterdir():
-                if item.is_dir() and item.name.startswith('week_'):
-                    try:
-                        week_num = int(item.name.split('_')[1])
-                        weeks.append(week_num)
-                    except (ValueError, IndexError):
-                        continue
-            weeks.sort()
+        weeks = get_week_numbers(regular_season_dir)
         
-        # Load draft data (for season index)
-        draft_data = None
-        draft_path = season_munged / "draft.json"
-        if draft_path.exists():
-            draft_data = load_json(draft_path)
+        # Weekly pages name trade partners from the unmunged rosters and users
+        season_unmunged = Path(UNMUNGED_DIR) / season
+        team_name_inputs = [season_unmunged / "rosters.json", season_unmunged / "users.json"]
         
         # Generate weekly reports
-        for week in weeks:
+        for idx, week in enumerate(weeks):
             week_dir = regular_season_dir / f"week_{week}"
             recap_path = week_dir / "recap.json"
             
             if recap_path.exists():
+                prev_week = weeks[idx - 1] if idx > 0 else None
+                next_week = weeks[idx + 1] if idx < len(weeks) - 1 else None
+                transactions_path = week_dir / "transactions.json"
+                output_path = season_reports / f"week_{week}.html"
+                
+                # The next week's recap is an input too: its arrival adds a nav link
+                next_recap_path = regular_season_dir / f"week_{next_week}" / "recap.json" if next_week else None
+                inputs = [recap_path, transactions_path, *team_name_inputs, *RENDER_SOURCES]
+                if next_recap_path:
+                    inputs.append(next_recap_path)
+                if not force and is_up_to_date(output_path, *inputs):
+                    logger.debug("  Week %s report is up to date, skipping", week)
+                    continue
+                
                 recap_data = load_json(recap_path)
                 if recap_data:
-                    prev_week = weeks[weeks.index(week) - 1] if week in weeks and weeks.index(week) > 0 else None
-                    next_week = weeks[weeks.index(week) + 1] if week in weeks and weeks.index(week) < len(weeks) - 1 else None
-                    
                     # Load transactions for this week
                     transactions = None
-                    transactions_path = week_dir / "transactions.json"
                     if transactions_path.exists():
                         transactions = load_json(transactions_path)
                     
-                    output_path = season_reports / f"week_{week}.html"
                     generate_weekly_html(
                         recap_data,
                         week,
@@ -101,15 +109,26 @@ def generate_all_reports() -> None:
         
         # Generate season index
         season_index_path = season_reports / "index.html"
-        generate_season_index(season, munged_dir, season_index_path, weeks=weeks, draft_data=draft_data)
-        logger.info(f"  Generated season index")
+        draft_path = season_munged / "draft.json"
+        postseason_path = season_munged / "postseason" / "postseason_recap.json"
+        season_inputs = [
+            regular_season_dir,
+            regular_season_dir / "reg_season_recap.json",
+            draft_path,
+            postseason_path,
+            *RENDER_SOURCES
+        ]
+        if force or not is_up_to_date(season_index_path, *season_inputs):
+            # Load draft data (for season index)
+            draft_data = load_json(draft_path) if draft_path.exists() else None
+            generate_season_index(season, munged_dir, season_index_path, weeks=weeks, draft_data=draft_data)
+            logger.info(f"  Generated season index")
         
         # Generate postseason report
-        postseason_path = season_munged / "postseason" / "postseason_recap.json"
-        if postseason_path.exists():
+        postseason_output = season_reports / "postseason.html"
+        if postseason_path.exists() and (force or not is_up_to_date(postseason_output, postseason_path, *RENDER_SOURCES)):
             postseason_data = load_json(postseason_path)
             if postseason_data:
-                postseason_output = season_reports / "postseason.html"
                 generate_postseason_html(postseason_data, season, postseason_output)
                 logger.info(f"  Generated postseason report")
     
@@ -117,9 +136,18 @@ def generate_all_reports() -> None:
     all_time_dir = munged_dir / "all_time"
     all_time_available = all_time_dir.exists() and any(all_time_dir.glob("*.csv"))
     
+    # The main index is one small page built from the season list, so it is
+    # always rebuilt rather than checked against directory mtimes
     main_index_path = reports_dir / "index.html"
     generate_main_index(seasons, main_index_path, all_time_available=all_time_available)
     logger.info("Generated main index page")
     
+    # Pages are written atomically without a per-file fsync; sync each output
+    # directory once so the renames into it are durable
+    output_dirs = [reports_dir, reports_dir / "all_time"] + [reports_dir / season for season in seasons]
+    for output_dir in output_dirs:
+        if output_dir.is_dir():
+            flush_reports_dir(output_dir)
+    
     logger.info(f"HTML reports generated successfully in {reports_dir}")
 
@@ -1,4 +1,5 @@
 """Core HTML generation utility functions."""
+from functools import lru_cache
 from typing import Any, Optional
 
 
@@ -15,8 +16,23 @@ def escape_html(text: Any) -> str:
     if text is None:
         return ''
     
-    text_str = str(text)
-    return (text_str
+    return _escape_str(str(text))
+
+
+def _escape_str(text: str) -> str:
+    """
+    Escape HTML special characters in a value that is already a string.
+    
+    Fast path for hot loops whose callers guarantee a str, skipping the
+    None check and str() conversion done by escape_html.
+    
+    Args:
+        text: String to escape
+        
+    Returns:
+        Escaped HTML string
+    """
+    return (text
             .replace('&', '&amp;')
             .replace('<', '&lt;')
             .replace('>', '&gt;')
@@ -24,6 +40,9 @@ def escape_html(text: Any) -> str:
             .replace("'", '&#x27;'))
 
 
+# Scores, records and win percentages repeat heavily across pages, so the
+# numeric formatters are memoized per (value, decimals)
+@lru_cache(maxsize=2048)
 def format_number(value: Optional[float], decimals: int = 2) -> str:
     """
     Format a number for display.
@@ -44,6 +63,7 @@ def format_number(value: Optional[float], decimals: int = 2) -> str:
         return str(value)
 
 
+@lru_cache(maxsize=2048)
 def format_percentage(value: Optional[float], decimals: int = 1) -> str:
     """
     Format a percentage for display.
@@ -3,7 +3,8 @@ from pathlib import Path
 from typing import List, Optional
 
 from .html_generator import escape_html
-from .templates import get_html_template, get_navigation
+from .templates import iter_html_template, get_navigation
+from utils.file_utils import write_text_atomic
 
 
 def generate_main_index(
@@ -64,13 +65,7 @@ def generate_main_index(
     else:
         content_parts.append('<p>No seasons available.</p>')
     
-    content = ''.join(content_parts)
-    
-    # Generate full HTML
-    html = get_html_template(title, nav, content)
-    
-    # Write to file
+    # Write the cached page chrome and content pieces without joining them first
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    write_text_atomic(output_path, iter_html_template(title, nav, content_parts))
 
@@ -1,11 +1,84 @@
 """Generate HTML reports for season summaries."""
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .html_generator import escape_html, format_number, format_percentage, format_record
-from .templates import get_html_template, get_navigation, get_breadcrumb
+from .templates import iter_html_template, get_navigation, get_breadcrumb
 from .bracket_generator import generate_simple_bracket
-from utils.json_utils import load_json
+from utils.file_utils import get_week_numbers, write_text_atomic
+from utils.json_utils import load_json_cached
+
+# Static markup and row templates, built once instead of per team/row
+_DRAFT_TABLE_HEAD = (
+    '<table class="draft-picks-table">'
+    '<thead><tr><th>Round</th><th>Pick</th><th>Player</th><th>Position</th></tr></thead>'
+    '<tbody>'
+)
+_DRAFT_PICK_ROW = '<tr><td>{}</td><td>{}</td><td><strong>{}</strong></td><td>{}</td></tr>'
+
+_STANDINGS_TABLE_HEAD = (
+    '<h2>Final Standings</h2>'
+    '<table class="standings-table">'
+    '<thead><tr><th class="rank">Rank</th><th>Team</th><th>Record</th>'
+    '<th>Win %</th><th>PF</th><th>PA</th></tr></thead>'
+    '<tbody>'
+)
+_STANDINGS_ROW = (
+    '<tr><td class="rank">{}</td><td><strong>{}</strong></td>'
+    '<td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>'
+)
+
+
+_get_pick_fields = itemgetter('round', 'pick_no', 'player_name', 'position')
+_get_standings_fields = itemgetter('team_name', 'wins', 'losses', 'ties', 'win_pct', 'pf', 'pa')
+
+
+def _pick_fields(pick: Dict) -> Tuple:
+    """
+    Extract the displayed fields of a draft pick.
+    
+    Args:
+        pick: Draft pick dictionary
+        
+    Returns:
+        Tuple of (round, pick_no, player_name, position)
+    """
+    try:
+        return _get_pick_fields(pick)
+    except KeyError:
+        # Malformed pick; fall back to per-field defaults
+        return (
+            pick.get('round', 0),
+            pick.get('pick_no', 0),
+            pick.get('player_name', 'Unknown'),
+            pick.get('position', '')
+        )
+
+
+def _standings_fields(team: Dict) -> Tuple:
+    """
+    Extract the displayed fields of a standings entry.
+    
+    Args:
+        team: Team standings dictionary
+        
+    Returns:
+        Tuple of (team_name, wins, losses, ties, win_pct, pf, pa)
+    """
+    try:
+        return _get_standings_fields(team)
+    except KeyError:
+        # Malformed row; fall back to per-field defaults
+        return (
+            team.get('team_name', 'Unknown'),
+            team.get('wins', 0),
+            team.get('losses', 0),
+            team.get('ties', 0),
+            team.get('win_pct', 0),
+            team.get('pf', 0),
+            team.get('pa', 0)
+        )
 
 
 def generate_draft_section(draft_data: Dict) -> str:
@@ -21,43 +94,25 @@ def generate_draft_section(draft_data: Dict) -> str:
     html = ['<h2>Draft Results</h2>']
     html.append('<div class="draft-container">')
     
-    # Sort teams by draft position
-    teams = sorted(
-        draft_data.items(),
-        key=lambda x: x[1].get('draft_position', 999)
-    )
+    # Sort teams by draft position (decorate-sort-undecorate; the index
+    # keeps ties in their original order and the comparison all in C)
+    decorated = [
+        (team_data.get('draft_position', 999), idx, team_name, team_data)
+        for idx, (team_name, team_data) in enumerate(draft_data.items())
+    ]
+    decorated.sort()
     
-    for team_name, team_data in teams:
+    for _, _, team_name, team_data in decorated:
         draft_pos = team_data.get('draft_position', 0)
         picks = team_data.get('picks', [])
         
-        html.append('<div class="draft-team">')
-        html.append(f'<h3>{escape_html(team_name)} - Pick #{draft_pos}</h3>')
-        html.append('<table class="draft-picks-table">')
-        html.append('<thead><tr>')
-        html.append('<th>Round</th>')
-        html.append('<th>Pick</th>')
-        html.append('<th>Player</th>')
-        html.append('<th>Position</th>')
-        html.append('</tr></thead>')
-        html.append('<tbody>')
-        
-        for pick in picks:
-            round_num = pick.get('round', 0)
-            pick_no = pick.get('pick_no', 0)
-            player_name = escape_html(pick.get('player_name', 'Unknown'))
-            position = escape_html(pick.get('position', ''))
-            
-            html.append('<tr>')
-            html.append(f'<td>{round_num}</td>')
-            html.append(f'<td>{pick_no}</td>')
-            html.append(f'<td><strong>{player_name}</strong></td>')
-            html.append(f'<td>{position}</td>')
-            html.append('</tr>')
-        
-        html.append('</tbody>')
-        html.append('</table>')
-        html.append('</div>')
+        html.append(f'<div class="draft-team"><h3>{escape_html(team_name)} - Pick #{draft_pos}</h3>')
+        html.append(_DRAFT_TABLE_HEAD)
+        html.extend(
+            _DRAFT_PICK_ROW.format(round_num, pick_no, escape_html(player_name), escape_html(position))
+            for round_num, pick_no, player_name, position in map(_pick_fields, picks)
+        )
+        html.append('</tbody></table></div>')
     
     html.append('</div>')
     return ''.join(html)
@@ -80,6 +135,11 @@ def generate_season_index(
         weeks: List of week numbers (if None, will be auto-detected)
         draft_data: Draft data dictionary (optional)
     """
+    reg_season_path = munged_dir / season / "regular_season" / "reg_season_recap.json"
+    postseason_path = munged_dir / season / "postseason" / "postseason_recap.json"
+    if weeks is None:
+        weeks = get_week_numbers(munged_dir / season / "regular_season")
+    
     title = f'{season} Season Overview'
     
     # Navigation
@@ -95,81 +155,40 @@ def generate_season_index(
         content_parts.append(generate_draft_section(draft_data))
     
     # Load final standings
-    reg_season_path = munged_dir / season / "regular_season" / "reg_season_recap.json"
     if reg_season_path.exists():
-        reg_season_data = load_json(reg_season_path)
+        # File bytes are reused while the file is unchanged
+        reg_season_data = load_json_cached(reg_season_path)
         if reg_season_data and reg_season_data.get('standings'):
             standings = reg_season_data.get('standings', [])
-            content_parts.append('<h2>Final Standings</h2>')
-            content_parts.append('<table class="standings-table">')
-            content_parts.append('<thead><tr>')
-            content_parts.append('<th class="rank">Rank</th>')
-            content_parts.append('<th>Team</th>')
-            content_parts.append('<th>Record</th>')
-            content_parts.append('<th>Win %</th>')
-            content_parts.append('<th>PF</th>')
-            content_parts.append('<th>PA</th>')
-            content_parts.append('</tr></thead>')
-            content_parts.append('<tbody>')
+            content_parts.append(_STANDINGS_TABLE_HEAD)
             
-            for rank, team in enumerate(standings, 1):
-                team_name = escape_html(team.get('team_name', 'Unknown'))
-                wins = team.get('wins', 0)
-                losses = team.get('losses', 0)
-                ties = team.get('ties', 0)
-                win_pct = team.get('win_pct', 0)
-                pf = team.get('pf', 0)
-                pa = team.get('pa', 0)
-                
-                content_parts.append('<tr>')
-                content_parts.append(f'<td class="rank">{rank}</td>')
-                content_parts.append(f'<td><strong>{team_name}</strong></td>')
-                content_parts.append(f'<td>{format_record(wins, losses, ties)}</td>')
-                content_parts.append(f'<td>{format_percentage(win_pct)}</td>')
-                content_parts.append(f'<td>{format_number(pf)}</td>')
-                content_parts.append(f'<td>{format_number(pa)}</td>')
-                content_parts.append('</tr>')
+            # Format every cell in one pass with local aliases, then render rows
+            esc, rec, pct, num = escape_html, format_record, format_percentage, format_number
+            rows = [
+                (rank, esc(name), rec(wins, losses, ties), pct(win_pct), num(pf), num(pa))
+                for rank, (name, wins, losses, ties, win_pct, pf, pa)
+                in enumerate(map(_standings_fields, standings), 1)
+            ]
+            row_format = _STANDINGS_ROW.format
+            content_parts.append(''.join(row_format(*row) for row in rows))
             
-            content_parts.append('</tbody>')
-            content_parts.append('</table>')
+            content_parts.append('</tbody></table>')
     
     # Week links
-    if weeks is None:
-        # Auto-detect weeks
-        season_dir = munged_dir / season / "regular_season"
-        if season_dir.exists():
-            weeks = []
-            for item in season_dir.iterdir():
-                if item.is_dir() and item.name.startswith('week_'):
-                    try:
-                        week_num = int(item.name.split('_')[1])
-                        weeks.append(week_num)
-                    except (ValueError, IndexError):
-                        continue
-            weeks.sort()
-    
     if weeks:
         content_parts.append('<h2>Weekly Recaps</h2>')
         content_parts.append('<div class="week-links">')
-        for week in weeks:
-            content_parts.append(f'<a href="week_{week}.html" class="week-link">Week {week}</a>')
+        content_parts.extend(f'<a href="week_{week}.html" class="week-link">Week {week}</a>' for week in weeks)
         content_parts.append('</div>')
     
     # Postseason link
-    postseason_path = munged_dir / season / "postseason" / "postseason_recap.json"
     if postseason_path.exists():
         content_parts.append('<h2>Postseason</h2>')
         content_parts.append('<p><a href="postseason.html" class="week-link">View Playoff Bracket</a></p>')
     
-    content = ''.join(content_parts)
-    
-    # Generate full HTML
-    html = get_html_template(title, nav, content)
-    
-    # Write to file
+    # Stream the page to disk fragment by fragment instead of joining it first
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    write_text_atomic(output_path, iter_html_template(title, nav, content_parts))
 
 
 def generate_postseason_html(
@@ -205,13 +224,7 @@ def generate_postseason_html(
     if losers_bracket:
         content_parts.append(generate_simple_bracket(losers_bracket, "Losers Bracket"))
     
-    content = ''.join(content_parts)
-    
-    # Generate full HTML
-    html = get_html_template(title, nav, content)
-    
-    # Write to file
+    # Stream the page to disk fragment by fragment instead of joining it first
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    write_text_atomic(output_path, iter_html_template(title, nav, content_parts))
 
@@ -1,4 +1,12 @@
 """HTML templates and CSS styling for reports."""
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator
+
+# Source files of the reports package (page builders, templates and CSS).
+# Skip checks treat these as inputs of every page, so editing the markup or
+# styles makes existing pages stale without needing --force.
+RENDER_SOURCES = tuple(sorted(Path(__file__).parent.glob('*.py')))
 
 # Embedded CSS styles
 CSS_STYLES = """
@@ -618,35 +626,85 @@ CSS_STYLES = """
 </style>
 """
 
-def get_html_template(title: str, nav: str, content: str) -> str:
+def _minify_css(css: str) -> str:
     """
-    Generate complete HTML page with embedded styles.
+    Strip indentation and line breaks from the embedded stylesheet.
+    
+    Every line of CSS_STYLES ends a tag, rule, declaration or selector list,
+    so the lines can be concatenated without changing their meaning.
     
     Args:
-        title: Page title
-        nav: Navigation HTML
-        content: Main content HTML
+        css: Stylesheet markup
         
     Returns:
-        Complete HTML document as string
+        Minified stylesheet markup
     """
-    return f"""<!DOCTYPE html>
+    return ''.join(line.strip() for line in css.splitlines())
+
+
+# Static page chrome, assembled once at import rather than re-interpolating
+# the embedded stylesheet into every page. The stylesheet is minified here
+# too, so every page ships it compacted at no per-render cost.
+_PAGE_HEAD_OPEN = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    {CSS_STYLES}
+    <title>"""
+_PAGE_HEAD_CLOSE = f"""</title>
+    {_minify_css(CSS_STYLES)}
 </head>
 <body>
     <div class="container">
-        {nav}
-        {content}
+        """
+_PAGE_CONTENT_OPEN = """
+        """
+_PAGE_CLOSE = """
     </div>
 </body>
 </html>
 """
 
+
+def get_html_template(title: str, nav: str, content: str) -> str:
+    """
+    Generate complete HTML page with embedded styles.
+    
+    Args:
+        title: Page title
+        nav: Navigation HTML
+        content: Main content HTML
+        
+    Returns:
+        Complete HTML document as string
+    """
+    return ''.join(iter_html_template(title, nav, (content,)))
+
+
+def iter_html_template(title: str, nav: str, content_parts: Iterable[str]) -> Iterator[str]:
+    """
+    Yield a complete HTML page piece by piece so it can be streamed to a file.
+    
+    Args:
+        title: Page title
+        nav: Navigation HTML
+        content_parts: Main content HTML fragments, in order
+        
+    Yields:
+        Fragments of the HTML document
+    """
+    yield _PAGE_HEAD_OPEN
+    yield title
+    yield _PAGE_HEAD_CLOSE
+    yield nav
+    yield _PAGE_CONTENT_OPEN
+    yield from content_parts
+    yield _PAGE_CLOSE
+
+
+# Navigation depends only on its arguments and repeats across every page of a
+# season, so both builders are memoized
+@lru_cache(maxsize=64)
 def get_navigation(season: str = None, week: int = None, prev_week: int = None, next_week: int = None, in_subdirectory: bool = False) -> str:
     """
     Generate navigation bar HTML with relative paths that work for both local and GitHub Pages.
@@ -695,6 +753,7 @@ def get_navigation(season: str = None, week: int = None, prev_week: int = None,
     nav_links.append('</div>')
     return ''.join(nav_links)
 
+@lru_cache(maxsize=64)
 def get_breadcrumb(season: str = None, week: int = None, in_subdirectory: bool = False) -> str:
     """
     Generate breadcrumb navigation with relative paths.
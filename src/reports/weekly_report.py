@@ -1,9 +1,156 @@
 """Generate HTML reports for weekly recaps."""
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
-from .html_generator import escape_html, format_number, format_percentage, format_record
-from .templates import get_html_template, get_navigation, get_breadcrumb
+from constants import UNMUNGED_DIR
+from mappers import load_rosters_map, load_users_map
+from .html_generator import escape_html, _escape_str, format_number, format_percentage, format_record
+from .templates import iter_html_template, get_navigation, get_breadcrumb
+from utils.file_utils import write_text_atomic
+from utils.matchup_utils import iter_matchup_pairs
+
+# Static table markup and award layout, built once at import instead of
+# being re-appended piece by piece on every report
+_MATCHUP_TABLE_HEAD = (
+    '<h2>Matchup Results</h2>'
+    '<table>'
+    '<thead><tr><th>Team 1</th><th>Points</th><th>Team 2</th><th>Points</th><th>Winner</th></tr></thead>'
+    '<tbody>'
+)
+_STANDINGS_TABLE_HEAD = (
+    '<h2>Current Standings</h2>'
+    '<table class="standings-table">'
+    '<thead><tr><th class="rank">Rank</th><th>Team</th><th>Record</th>'
+    '<th>Win %</th><th>PF</th><th>PA</th></tr></thead>'
+    '<tbody>'
+)
+_TRADES_TABLE_HEAD = (
+    '<h3>💼 Trades</h3>'
+    '<table>'
+    '<thead><tr><th>Team 1</th><th>Gets</th><th>Gives</th><th>Team 2</th><th>Gets</th><th>Gives</th>'
+    '<th>Time</th></tr></thead>'
+    '<tbody>'
+)
+_WAIVERS_TABLE_HEAD = (
+    '<h3>📋 Waivers</h3>'
+    '<table>'
+    '<thead><tr><th>Team</th><th>Adds</th><th>Drops</th><th>Time</th><th></th></tr></thead>'
+    '<tbody>'
+)
+_FREE_AGENTS_TABLE_HEAD = (
+    '<h3>🆓 Free Agents</h3>'
+    '<table>'
+    '<thead><tr><th>Team</th><th>Adds</th><th>Drops</th><th>Time</th></tr></thead>'
+    '<tbody>'
+)
+_TABLE_CLOSE = '</tbody></table>'
+_AWARD_BOX = '<div class="award-box"><h4>{}</h4><p><strong>{}</strong>{}</p></div>'
+
+# Weekly awards in display order: (recap key, heading, detail renderer)
+_AWARD_SPECS = (
+    # Efficiency awards show points left on the bench (optimal_score - actual_score)
+    ('most_efficient_manager', '🎯 Most Efficient Manager',
+     lambda a: f' - Left only {format_number(a.get("optimal_score", 0) - a.get("actual_score", 0))} points on the bench'),
+    ('least_efficient_manager', '😅 Least Efficient Manager',
+     lambda a: f' - Left {format_number(a.get("optimal_score", 0) - a.get("actual_score", 0))} points on the bench'),
+    ('highest_points_in_loss', '💔 Highest Points in a Loss',
+     lambda a: f' - Scored {format_number(a.get("points", 0))} points and still lost'
+               f' (opponent scored {format_number(a.get("opponent_points", 0))})'),
+    ('lowest_points_in_win', '🍀 Lowest Points in a Win',
+     lambda a: f' - Scored {format_number(a.get("points", 0))} points and still won'
+               f' (opponent scored {format_number(a.get("opponent_points", 0))})'),
+    ('largest_winning_margin', '💪 Largest Winning Margin',
+     lambda a: f' - Won by {format_number(a.get("margin", 0))} points'
+               f' ({format_number(a.get("points", 0))} - {format_number(a.get("opponent_points", 0))})'),
+    ('smallest_winning_margin', '😬 Smallest Winning Margin',
+     lambda a: f' - Won by {format_number(a.get("margin", 0))} points'
+               f' ({format_number(a.get("points", 0))} - {format_number(a.get("opponent_points", 0))})'),
+)
+
+# Lineup slots in display order for position-based teams
+_POSITION_ORDER = ('QB', 'RB1', 'RB2', 'WR1', 'WR2', 'TE', 'FLEX1', 'FLEX2', 'K', 'DEF')
+
+# Expand/collapse scripts for the matchup and transaction detail rows
+_MATCHUP_TOGGLE_JS = '''
+    <script>
+    function toggleMatchup(index) {
+        const details = document.getElementById('matchup-' + index);
+        const row = details.previousElementSibling;
+        if (details.classList.contains('expanded')) {
+            details.classList.remove('expanded');
+            row.classList.remove('expanded');
+        } else {
+            // Close all other expanded matchups
+            document.querySelectorAll('.matchup-details.expanded').forEach(el => {
+                el.classList.remove('expanded');
+                el.previousElementSibling.classList.remove('expanded');
+            });
+            details.classList.add('expanded');
+            row.classList.add('expanded');
+        }
+    }
+    </script>
+    '''
+
+_TRANSACTION_TOGGLE_JS = '''
+    <script>
+    function toggleTransaction(index) {
+        const details = document.getElementById('transaction-' + index);
+        const row = details.previousElementSibling;
+        if (details.classList.contains('expanded')) {
+            details.classList.remove('expanded');
+            row.classList.remove('expanded');
+        } else {
+            // Close all other expanded transactions
+            document.querySelectorAll('.transaction-details.expanded').forEach(el => {
+                el.classList.remove('expanded');
+                el.previousElementSibling.classList.remove('expanded');
+            });
+            details.classList.add('expanded');
+            row.classList.add('expanded');
+        }
+    }
+    </script>
+    '''
+
+
+def _position_span(player: Dict) -> str:
+    """
+    Generate the position label for a player, if they have positions.
+    
+    Args:
+        player: Player dictionary
+        
+    Returns:
+        HTML span string, or empty string if the player has no positions
+    """
+    positions = player.get('positions')
+    if not positions:
+        return ''
+    return f'<span class="player-position">({", ".join(positions)})</span>'
+
+
+def _render_player_ul(players: List[Dict]) -> str:
+    """
+    Generate a player list (name, positions, points) for a team highlight.
+    
+    Args:
+        players: List of player dictionaries
+        
+    Returns:
+        HTML unordered list string
+    """
+    esc, num = escape_html, format_number
+    items = ''.join(
+        f'<li><span class="player-name">{esc(player.get("player_name", "Unknown"))}</span>'
+        f'{_position_span(player)}'
+        f'<span class="player-points">{num(player.get("points", 0))} pts</span></li>'
+        for player in players
+    )
+    return f'<ul class="player-list">{items}</ul>'
 
 
 def generate_player_list_html(players: List[Dict], is_bench: bool = False) -> str:
@@ -20,193 +167,149 @@ def generate_player_list_html(players: List[Dict], is_bench: bool = False) -> st
     if not players:
         return '<p style="color: #7f8c8d; font-style: italic;">No players</p>'
     
+    esc, num = escape_html, format_number
+    item_open = f'<div class="player-item {"bench" if is_bench else ""}"><div><span class="player-name">'
     html = []
     for player in players:
-        player_name = escape_html(player.get('player_name', 'Unknown'))
-        points = format_number(player.get('points', 0))
-        positions = player.get('positions', [])
-        position_str = ', '.join(positions) if positions else ''
-        
-        bench_class = 'bench' if is_bench else ''
-        html.append(f'<div class="player-item {bench_class}">')
-        html.append('<div>')
-        html.append(f'<span class="player-name">{player_name}</span>')
-        if position_str:
-            html.append(f'<span class="player-position">({position_str})</span>')
-        html.append('</div>')
-        html.append(f'<span class="player-points">{points} pts</span>')
-        html.append('</div>')
+        html.append(
+            f'{item_open}{esc(player.get("player_name", "Unknown"))}</span>{_position_span(player)}</div>'
+            f'<span class="player-points">{num(player.get("points", 0))} pts</span></div>'
+        )
     
     return ''.join(html)
 
 
-def generate_matchup_table(matchups: List[Dict]) -> str:
+def generate_matchup_table(
+    matchups: List[Dict],
+    out: Optional[Callable[[str], None]] = None
+) -> Optional[str]:
     """
     Generate HTML table for matchup results with expandable player details.
     
     Args:
         matchups: List of matchup dictionaries
+        out: Callback receiving HTML fragments in order (e.g. a file's write
+            method); if omitted the fragments are collected and returned
         
     Returns:
-        HTML table string
-    """
-    html = ['<h2>Matchup Results</h2>']
-    html.append('<table>')
-    html.append('<thead><tr>')
-    html.append('<th>Team 1</th>')
-    html.append('<th>Points</th>')
-    html.append('<th>Team 2</th>')
-    html.append('<th>Points</th>')
-    html.append('<th>Winner</th>')
-    html.append('</tr></thead>')
-    html.append('<tbody>')
-    
-    # Group matchups by matchup_id
-    matchup_groups = {}
-    for matchup in matchups:
-        matchup_id = matchup.get('matchup_id')
-        if matchup_id not in matchup_groups:
-            matchup_groups[matchup_id] = []
-        matchup_groups[matchup_id].append(matchup)
+        HTML table string, or None if out was given
+    """
+    buf = None
+    if out is None:
+        buf = []
+        out = buf.append
+    
+    out(_MATCHUP_TABLE_HEAD)
     
     # Display each matchup as a single row with expandable details
+    esc, num, player_list = escape_html, format_number, generate_player_list_html
     matchup_index = 0
-    for matchup_id, matchup_pair in sorted(matchup_groups.items()):
-        if len(matchup_pair) == 2:
-            team1 = matchup_pair[0]
-            team2 = matchup_pair[1]
-            
-            points1 = team1.get('points', 0)
-            points2 = team2.get('points', 0)
-            team1_name = escape_html(team1.get('team_name', 'Unknown'))
-            team2_name = escape_html(team2.get('team_name', 'Unknown'))
-            
-            # Determine winner
-            if points1 > points2:
-                winner_name = team1_name
-                winner_class = 'winner'
-            elif points2 > points1:
-                winner_name = team2_name
-                winner_class = 'winner'
-            else:
-                winner_name = 'Tie'
-                winner_class = 'tie'
-            
-            # Main matchup row (clickable)
-            html.append(f'<tr class="matchup-row {winner_class}" onclick="toggleMatchup({matchup_index})">')
-            html.append(f'<td><strong>{team1_name}</strong></td>')
-            html.append(f'<td>{format_number(points1)}</td>')
-            html.append(f'<td><strong>{team2_name}</strong></td>')
-            html.append(f'<td>{format_number(points2)}</td>')
-            html.append(f'<td><strong>{winner_name}</strong><span class="expand-icon">▶</span></td>')
-            html.append('</tr>')
-            
-            # Expandable details row
-            html.append(f'<tr class="matchup-details" id="matchup-{matchup_index}">')
-            html.append('<td colspan="5">')
-            html.append('<div class="matchup-details-content">')
-            
-            # Team 1 details
-            html.append('<div class="team-details">')
-            html.append(f'<h4>{team1_name} - {format_number(points1)} points</h4>')
-            
-            # Starters
-            starters1 = team1.get('starters', [])
-            if starters1:
-                html.append('<div class="player-section">')
-                html.append('<h5>Starters</h5>')
-                html.append(generate_player_list_html(starters1, is_bench=False))
-                html.append('</div>')
-            
-            # Bench
-            bench1 = team1.get('bench', [])
-            if bench1:
-                html.append('<div class="player-section">')
-                html.append('<h5>Bench</h5>')
-                html.append(generate_player_list_html(bench1, is_bench=True))
-                html.append('</div>')
-            
-            html.append('</div>')  # End team-details
-            
-            # Team 2 details
-            html.append('<div class="team-details">')
-            html.append(f'<h4>{team2_name} - {format_number(points2)} points</h4>')
-            
-            # Starters
-            starters2 = team2.get('starters', [])
-            if starters2:
-                html.append('<div class="player-section">')
-                html.append('<h5>Starters</h5>')
-                html.append(generate_player_list_html(starters2, is_bench=False))
-                html.append('</div>')
-            
-            # Bench
-            bench2 = team2.get('bench', [])
-            if bench2:
-                html.append('<div class="player-section">')
-                html.append('<h5>Bench</h5>')
-                html.append(generate_player_list_html(bench2, is_bench=True))
-                html.append('</div>')
-            
-            html.append('</div>')  # End team-details
-            html.append('</div>')  # End matchup-details-content
-            html.append('</td>')
-            html.append('</tr>')
-            
-            matchup_index += 1
-    
-    html.append('</tbody>')
-    html.append('</table>')
+    # Matchup ids with exactly two teams, in ascending id order (recap matchups
+    # arrive in roster order)
+    for team1, team2 in iter_matchup_pairs(matchups):
+        points1 = team1.get('points', 0)
+        points2 = team2.get('points', 0)
+        team1_name = esc(team1.get('team_name', 'Unknown'))
+        team2_name = esc(team2.get('team_name', 'Unknown'))
+        
+        # Determine winner
+        if points1 > points2:
+            winner_name = team1_name
+            winner_class = 'winner'
+        elif points2 > points1:
+            winner_name = team2_name
+            winner_class = 'winner'
+        else:
+            winner_name = 'Tie'
+            winner_class = 'tie'
+        
+        points1_str = num(points1)
+        points2_str = num(points2)
+        
+        # Main matchup row (clickable), then open the expandable details row
+        out(
+            f'<tr class="matchup-row {winner_class}" onclick="toggleMatchup({matchup_index})">'
+            f'<td><strong>{team1_name}</strong></td><td>{points1_str}</td>'
+            f'<td><strong>{team2_name}</strong></td><td>{points2_str}</td>'
+            f'<td><strong>{winner_name}</strong><span class="expand-icon">▶</span></td></tr>'
+            f'<tr class="matchup-details" id="matchup-{matchup_index}">'
+            '<td colspan="5"><div class="matchup-details-content">'
+            f'<div class="team-details"><h4>{team1_name} - {points1_str} points</h4>'
+        )
+        
+        # Starters
+        starters1 = team1.get('starters', [])
+        if starters1:
+            out('<div class="player-section">')
+            out('<h5>Starters</h5>')
+            out(player_list(starters1, is_bench=False))
+            out('</div>')
+        
+        # Bench
+        bench1 = team1.get('bench', [])
+        if bench1:
+            out('<div class="player-section">')
+            out('<h5>Bench</h5>')
+            out(player_list(bench1, is_bench=True))
+            out('</div>')
+        
+        # End team 1 details, start team 2 details
+        out(f'</div><div class="team-details"><h4>{team2_name} - {points2_str} points</h4>')
+        
+        # Starters
+        starters2 = team2.get('starters', [])
+        if starters2:
+            out('<div class="player-section">')
+            out('<h5>Starters</h5>')
+            out(player_list(starters2, is_bench=False))
+            out('</div>')
+        
+        # Bench
+        bench2 = team2.get('bench', [])
+        if bench2:
+            out('<div class="player-section">')
+            out('<h5>Bench</h5>')
+            out(player_list(bench2, is_bench=True))
+            out('</div>')
+        
+        # End team-details, matchup-details-content and the details row
+        out('</div></div></td></tr>')
+        
+        matchup_index += 1
+    
+    out(_TABLE_CLOSE)
     
     # Add JavaScript for toggling
-    html.append('''
-    <script>
-    function toggleMatchup(index) {
-        const details = document.getElementById('matchup-' + index);
-        const row = details.previousElementSibling;
-        if (details.classList.contains('expanded')) {
-            details.classList.remove('expanded');
-            row.classList.remove('expanded');
-        } else {
-            // Close all other expanded matchups
-            document.querySelectorAll('.matchup-details.expanded').forEach(el => {
-                el.classList.remove('expanded');
-                el.previousElementSibling.classList.remove('expanded');
-            });
-            details.classList.add('expanded');
-            row.classList.add('expanded');
-        }
-    }
-    </script>
-    ''')
+    out(_MATCHUP_TOGGLE_JS)
     
-    return ''.join(html)
+    return ''.join(buf) if buf is not None else None
 
 
-def generate_standings_table(standings: List[Dict]) -> str:
+def generate_standings_table(
+    standings: List[Dict],
+    out: Optional[Callable[[str], None]] = None
+) -> Optional[str]:
     """
     Generate HTML table for standings.
     
     Args:
         standings: List of standings dictionaries
+        out: Callback receiving HTML fragments in order (e.g. a file's write
+            method); if omitted the fragments are collected and returned
         
     Returns:
-        HTML table string
-    """
-    html = ['<h2>Current Standings</h2>']
-    html.append('<table class="standings-table">')
-    html.append('<thead><tr>')
-    html.append('<th class="rank">Rank</th>')
-    html.append('<th>Team</th>')
-    html.append('<th>Record</th>')
-    html.append('<th>Win %</th>')
-    html.append('<th>PF</th>')
-    html.append('<th>PA</th>')
-    html.append('</tr></thead>')
-    html.append('<tbody>')
+        HTML table string, or None if out was given
+    """
+    buf = None
+    if out is None:
+        buf = []
+        out = buf.append
+    
+    out(_STANDINGS_TABLE_HEAD)
     
+    esc, num, pct, rec = escape_html, format_number, format_percentage, format_record
     for rank, team in enumerate(standings, 1):
-        team_name = escape_html(team.get('team_name', 'Unknown'))
+        team_name = esc(team.get('team_name', 'Unknown'))
         wins = team.get('wins', 0)
         losses = team.get('losses', 0)
         ties = team.get('ties', 0)
@@ -214,100 +317,45 @@ def generate_standings_table(standings: List[Dict]) -> str:
         pf = team.get('pf', 0)
         pa = team.get('pa', 0)
         
-        html.append('<tr>')
-        html.append(f'<td class="rank">{rank}</td>')
-        html.append(f'<td><strong>{team_name}</strong></td>')
-        html.append(f'<td>{format_record(wins, losses, ties)}</td>')
-        html.append(f'<td>{format_percentage(win_pct)}</td>')
-        html.append(f'<td>{format_number(pf)}</td>')
-        html.append(f'<td>{format_number(pa)}</td>')
-        html.append('</tr>')
-    
-    html.append('</tbody>')
-    html.append('</table>')
-    return ''.join(html)
+        out(
+            f'<tr><td class="rank">{rank}</td><td><strong>{team_name}</strong></td>'
+            f'<td>{rec(wins, losses, ties)}</td><td>{pct(win_pct)}</td>'
+            f'<td>{num(pf)}</td><td>{num(pa)}</td></tr>'
+        )
+    
+    out(_TABLE_CLOSE)
+    return ''.join(buf) if buf is not None else None
 
 
-def generate_awards_section(awards: Dict) -> str:
+def generate_awards_section(
+    awards: Dict,
+    out: Optional[Callable[[str], None]] = None
+) -> Optional[str]:
     """
     Generate HTML section for weekly awards.
     
     Args:
         awards: Awards dictionary
+        out: Callback receiving HTML fragments in order (e.g. a file's write
+            method); if omitted the fragments are collected and returned
         
     Returns:
-        HTML string for awards section
+        HTML string for awards section, or None if out was given
     """
-    html = ['<h2>Weekly Awards</h2>']
+    buf = None
+    if out is None:
+        buf = []
+        out = buf.append
     
-    # Most/Least Efficient Manager
-    most_eff = awards.get('most_efficient_manager')
-    least_eff = awards.get('least_efficient_manager')
+    out('<h2>Weekly Awards</h2>')
     
-    if most_eff:
-        # Calculate points_left from optimal_score - actual_score
-        optimal_score = most_eff.get('optimal_score', 0)
-        actual_score = most_eff.get('actual_score', 0)
-        points_left = optimal_score - actual_score
-        
-        html.append('<div class="award-box">')
-        html.append('<h4>🎯 Most Efficient Manager</h4>')
-        html.append(f'<p><strong>{escape_html(most_eff.get("team_name", "Unknown"))}</strong>')
-        html.append(f' - Left only {format_number(points_left)} points on the bench</p>')
-        html.append('</div>')
+    esc, box = escape_html, _AWARD_BOX.format
+    for key, title, render_detail in _AWARD_SPECS:
+        award = awards.get(key)
+        if award:
+            out(box(title, esc(award.get('team_name', 'Unknown')), render_detail(award)))
     
-    if least_eff:
-        # Calculate points_left from optimal_score - actual_score
-        optimal_score = least_eff.get('optimal_score', 0)
-        actual_score = least_eff.get('actual_score', 0)
-        points_left = optimal_score - actual_score
-        
-        html.append('<div class="award-box">')
-        html.append('<h4>😅 Least Efficient Manager</h4>')
-        html.append(f'<p><strong>{escape_html(least_eff.get("team_name", "Unknown"))}</strong>')
-        html.append(f' - Left {format_number(points_left)} points on the bench</p>')
-        html.append('</div>')
-    
-    # Highest Points in Loss
-    highest_loss = awards.get('highest_points_in_loss')
-    if highest_loss:
-        html.append('<div class="award-box">')
-        html.append('<h4>💔 Highest Points in a Loss</h4>')
-        html.append(f'<p><strong>{escape_html(highest_loss.get("team_name", "Unknown"))}</strong>')
-        html.append(f' - Scored {format_number(highest_loss.get("points", 0))} points and still lost')
-        html.append(f' (opponent scored {format_number(highest_loss.get("opponent_points", 0))})</p>')
-        html.append('</div>')
-    
-    # Lowest Points in Win
-    lowest_win = awards.get('lowest_points_in_win')
-    if lowest_win:
-        html.append('<div class="award-box">')
-        html.append('<h4>🍀 Lowest Points in a Win</h4>')
-        html.append(f'<p><strong>{escape_html(lowest_win.get("team_name", "Unknown"))}</strong>')
-        html.append(f' - Scored {format_number(lowest_win.get("points", 0))} points and still won')
-        html.append(f' (opponent scored {format_number(lowest_win.get("opponent_points", 0))})</p>')
-        html.append('</div>')
-    
-    # Largest/Smallest Winning Margin
-    largest_margin = awards.get('largest_winning_margin')
-    if largest_margin:
-        html.append('<div class="award-box">')
-        html.append('<h4>💪 Largest Winning Margin</h4>')
-        html.append(f'<p><strong>{escape_html(largest_margin.get("team_name", "Unknown"))}</strong>')
-        html.append(f' - Won by {format_number(largest_margin.get("margin", 0))} points')
-        html.append(f' ({format_number(largest_margin.get("points", 0))} - {format_number(largest_margin.get("opponent_points", 0))})</p>')
-        html.append('</div>')
-    
-    smallest_margin = awards.get('smallest_winning_margin')
-    if smallest_margin:
-        html.append('<div class="award-box">')
-        html.append('<h4>😬 Smallest Winning Margin</h4>')
-        html.append(f'<p><strong>{escape_html(smallest_margin.get("team_name", "Unknown"))}</strong>')
-        html.append(f' - Won by {format_number(smallest_margin.get("margin", 0))} points')
-        html.append(f' ({format_number(smallest_margin.get("points", 0))} - {format_number(smallest_margin.get("opponent_points", 0))})</p>')
-        html.append('</div>')
-    
-    return ''.join(html)
+    return ''.join(buf) if buf is not None else None
 
 
 def convert_position_team_to_players(team: Dict) -> List[Dict]:
@@ -320,18 +368,12 @@ def convert_position_team_to_players(team: Dict) -> List[Dict]:
     Returns:
         List of player dictionaries
     """
-    players = []
-    position_order = ['QB', 'RB1', 'RB2', 'WR1', 'WR2', 'TE', 'FLEX1', 'FLEX2', 'K', 'DEF']
-    
-    for pos in position_order:
-        if pos in team and team[pos]:
-            player = team[pos].copy()
-            # Add position to player dict if not present
-            if 'positions' not in player:
-                player['positions'] = [pos]
-            players.append(player)
-    
-    return players
+    # Copy each filled slot, adding its position if the player dict lacks one
+    return [
+        {**team[pos], 'positions': team[pos].get('positions', [pos])}
+        for pos in _POSITION_ORDER
+        if team.get(pos)
+    ]
 
 
 def generate_team_highlight(team: Dict, title: str) -> str:
@@ -378,22 +420,7 @@ def generate_team_highlight(team: Dict, title: str) -> str:
         
         html.append(f'<p><strong>{team_name}</strong>')
         html.append(f' - {format_number(total_points)} points</p>')
-        html.append('<ul class="player-list">')
-        
-        for player in players:
-            player_name = escape_html(player.get('player_name', 'Unknown'))
-            points = format_number(player.get('points', 0))
-            positions = player.get('positions', [])
-            position_str = ', '.join(positions) if positions else ''
-            
-            html.append('<li>')
-            html.append(f'<span class="player-name">{player_name}</span>')
-            if position_str:
-                html.append(f'<span class="player-position">({position_str})</span>')
-            html.append(f'<span class="player-points">{points} pts</span>')
-            html.append('</li>')
-        
-        html.append('</ul>')
+        html.append(_render_player_ul(players))
         html.append('</div>')
         return ''.join(html)
     
@@ -404,22 +431,7 @@ def generate_team_highlight(team: Dict, title: str) -> str:
         
         html.append(f'<p><strong>{team_name}</strong>')
         html.append(f' - {total_points} points</p>')
-        html.append('<ul class="player-list">')
-        
-        for player in team.get('players', []):
-            player_name = escape_html(player.get('player_name', 'Unknown'))
-            points = format_number(player.get('points', 0))
-            positions = player.get('positions', [])
-            position_str = ', '.join(positions) if positions else ''
-            
-            html.append('<li>')
-            html.append(f'<span class="player-name">{player_name}</span>')
-            if position_str:
-                html.append(f'<span class="player-position">({position_str})</span>')
-            html.append(f'<span class="player-points">{points} pts</span>')
-            html.append('</li>')
-        
-        html.append('</ul>')
+        html.append(_render_player_ul(team['players']))
         html.append('</div>')
         return ''.join(html)
     
@@ -430,6 +442,56 @@ def generate_team_highlight(team: Dict, title: str) -> str:
     return ''.join(html)
 
 
+@lru_cache(maxsize=16)
+def _load_season_rosters_map(
+    season: str,
+    rosters_mtime_ns: int,
+    users_mtime_ns: Optional[int]
+) -> Dict[int, Dict[str, str]]:
+    """
+    Load and memoize a season's roster ID to team info mapping.
+    
+    Args:
+        season: Season year
+        rosters_mtime_ns: Modification time of rosters.json, so an updated file misses the cache
+        users_mtime_ns: Modification time of users.json (None if missing), so a
+            renamed user misses the cache too
+        
+    Returns:
+        Dictionary mapping roster_id to team info, or empty dict if loading fails
+    """
+    unmunged_dir = Path(UNMUNGED_DIR) / season
+    try:
+        users_map = load_users_map(unmunged_dir / "users.json")
+        return load_rosters_map(unmunged_dir / "rosters.json", users_map)
+    except Exception:
+        # Fallback if loading fails
+        return {}
+
+
+def _cached_rosters_map(season: str) -> Dict[int, Dict[str, str]]:
+    """
+    Get a season's roster ID to team info mapping, reloading it when
+    rosters.json or users.json changes.
+    
+    Args:
+        season: Season year
+        
+    Returns:
+        Dictionary mapping roster_id to team info, or empty dict if unavailable
+    """
+    unmunged_dir = Path(UNMUNGED_DIR) / season
+    try:
+        rosters_mtime_ns = (unmunged_dir / "rosters.json").stat().st_mtime_ns
+    except OSError:
+        return {}
+    try:
+        users_mtime_ns = (unmunged_dir / "users.json").stat().st_mtime_ns
+    except OSError:
+        users_mtime_ns = None
+    return _load_season_rosters_map(season, rosters_mtime_ns, users_mtime_ns)
+
+
 def group_failed_claims_by_player(transactions: List[Dict]) -> Dict[str, List[Dict]]:
     """
     Group failed waiver claims by the player being added.
@@ -440,17 +502,14 @@ def group_failed_claims_by_player(transactions: List[Dict]) -> Dict[str, List[Di
     Returns:
         Dictionary mapping player name to list of failed claims
     """
-    failed_by_player = {}
+    failed_by_player = defaultdict(list)
     
     for transaction in transactions:
         if transaction.get('type') == 'waiver' and transaction.get('status') == 'failed':
-            adds = transaction.get('adds', {})
+            adds = transaction.get('adds')
             if adds:
-                # Get the first (and usually only) player being added
-                player_name = list(adds.keys())[0]
-                if player_name not in failed_by_player:
-                    failed_by_player[player_name] = []
-                failed_by_player[player_name].append(transaction)
+                # Key by the first (and usually only) player being added
+                failed_by_player[next(iter(adds))].append(transaction)
     
     return failed_by_player
 
@@ -469,15 +528,31 @@ def format_timestamp(timestamp: Optional[int]) -> str:
         return ''
     
     try:
-        from datetime import datetime
         # Convert from milliseconds to seconds
-        dt = datetime.fromtimestamp(timestamp / 1000)
-        return dt.strftime('%m/%d %I:%M %p')
+        return datetime.fromtimestamp(timestamp / 1000).strftime('%m/%d %I:%M %p')
     except (ValueError, OSError, OverflowError):
         return ''
 
 
-def generate_transactions_table(transactions: List[Dict], season: str = None) -> str:
+def _format_created_times(transactions: List[Dict]) -> List[str]:
+    """
+    Format the creation time of each transaction in one pass.
+    
+    Args:
+        transactions: List of transaction dictionaries
+        
+    Returns:
+        Formatted time strings, in the same order as transactions
+    """
+    fmt = format_timestamp
+    return [fmt(t.get('created')) for t in transactions]
+
+
+def generate_transactions_table(
+    transactions: List[Dict],
+    season: str = None,
+    out: Optional[Callable[[str], None]] = None
+) -> Optional[str]:
     """
     Generate HTML table for transactions with expandable failed claims.
     Transactions are organized by type (Trades first, then Waivers) and sorted by time.
@@ -485,48 +560,44 @@ def generate_transactions_table(transactions: List[Dict], season: str = None) ->
     Args:
         transactions: List of transaction dictionaries
         season: Season year (optional, used to load rosters for trade team names)
+        out: Callback receiving HTML fragments in order (e.g. a file's write
+            method); if omitted the fragments are collected and returned
         
     Returns:
-        HTML table string
+        HTML table string, or None if out was given
     """
-    html = ['<h2>Transactions</h2>']
+    buf = None
+    if out is None:
+        buf = []
+        out = buf.append
     
-    if not transactions:
-        html.append('<p>No transactions this week.</p>')
-        return ''.join(html)
-    
-    # Filter to only successful transactions (complete status)
-    successful_transactions = [
-        t for t in transactions
-        if t.get('status') == 'complete'
-    ]
+    out('<h2>Transactions</h2>')
     
-    if not successful_transactions:
-        html.append('<p>No successful transactions this week.</p>')
-        return ''.join(html)
-    
-    # Load rosters map for trade team names
-    rosters_map = {}
-    if season:
-        from pathlib import Path
-        from constants import UNMUNGED_DIR
-        from mappers import load_rosters_map
-        
-        unmunged_dir = Path(UNMUNGED_DIR) / season
-        if unmunged_dir.exists():
-            try:
-                rosters_map = load_rosters_map(unmunged_dir)
-            except Exception:
-                # Fallback if loading fails
-                rosters_map = {}
-    
-    # Group failed claims by player
-    failed_by_player = group_failed_claims_by_player(transactions)
-    
-    # Separate trades, waivers, and free agents, sort each by creation time (most recent first)
-    trades = [t for t in successful_transactions if t.get('type') == 'trade']
-    waivers = [t for t in successful_transactions if t.get('type') == 'waiver']
-    free_agents = [t for t in successful_transactions if t.get('type') == 'free_agent']
+    if not transactions:
+        out('<p>No transactions this week.</p>')
+        return ''.join(buf) if buf is not None else None
+    
+    # Split successful (complete status) transactions by type in a single pass
+    trades, waivers, free_agents = [], [], []
+    buckets = {'trade': trades, 'waiver': waivers, 'free_agent': free_agents}
+    has_successful = False
+    for t in transactions:
+        if t.get('status') != 'complete':
+            continue
+        has_successful = True
+        bucket = buckets.get(t.get('type'))
+        if bucket is not None:
+            bucket.append(t)
+    
+    if not has_successful:
+        out('<p>No successful transactions this week.</p>')
+        return ''.join(buf) if buf is not None else None
+    
+    # Load rosters map for trade team names (only trade rows use it)
+    rosters_map = _cached_rosters_map(season) if season and trades else {}
+    
+    # Group failed claims by player (only waiver rows look them up)
+    failed_by_player = group_failed_claims_by_player(transactions) if waivers else {}
     
     # Sort by creation time (most recent first)
     trades.sort(key=lambda x: x.get('created', 0), reverse=True)
@@ -537,127 +608,101 @@ def generate_transactions_table(transactions: List[Dict], season: str = None) ->
     
     # Generate trades section
     if trades:
-        html.append('<h3>💼 Trades</h3>')
-        html.append('<table>')
-        html.append('<thead><tr>')
-        html.append('<th>Team 1</th>')
-        html.append('<th>Gets</th>')
-        html.append('<th>Gives</th>')
-        html.append('<th>Team 2</th>')
-        html.append('<th>Gets</th>')
-        html.append('<th>Gives</th>')
-        html.append('<th>Time</th>')
-        html.append('</tr></thead>')
-        html.append('<tbody>')
-        
-        for transaction in trades:
-            _generate_trade_row(html, transaction, rosters_map, show_time=True)
-        
-        html.append('</tbody>')
-        html.append('</table>')
+        out(_TRADES_TABLE_HEAD)
+        
+        for transaction, time_str in zip(trades, _format_created_times(trades)):
+            _generate_trade_row(out, transaction, rosters_map, show_time=True, time_str=time_str)
+        
+        out(_TABLE_CLOSE)
     
     # Generate waivers section
     if waivers:
-        html.append('<h3>📋 Waivers</h3>')
-        html.append('<table>')
-        html.append('<thead><tr>')
-        html.append('<th>Team</th>')
-        html.append('<th>Adds</th>')
-        html.append('<th>Drops</th>')
-        html.append('<th>Time</th>')
-        html.append('<th></th>')
-        html.append('</tr></thead>')
-        html.append('<tbody>')
-        
-        for transaction in waivers:
+        out(_WAIVERS_TABLE_HEAD)
+        
+        for transaction, time_str in zip(waivers, _format_created_times(waivers)):
             transaction_index = _generate_transaction_row(
-                html, transaction, failed_by_player, transaction_index, show_time=True
+                out, transaction, failed_by_player, transaction_index, show_time=True, time_str=time_str
             )
         
-        html.append('</tbody>')
-        html.append('</table>')
+        out(_TABLE_CLOSE)
     
     # Generate free agents section
     if free_agents:
-        html.append('<h3>🆓 Free Agents</h3>')
-        html.append('<table>')
-        html.append('<thead><tr>')
-        html.append('<th>Team</th>')
-        html.append('<th>Adds</th>')
-        html.append('<th>Drops</th>')
-        html.append('<th>Time</th>')
-        html.append('</tr></thead>')
-        html.append('<tbody>')
-        
-        for transaction in free_agents:
+        out(_FREE_AGENTS_TABLE_HEAD)
+        
+        for transaction, time_str in zip(free_agents, _format_created_times(free_agents)):
             transaction_index = _generate_transaction_row(
-                html, transaction, failed_by_player, transaction_index, show_time=True
+                out, transaction, failed_by_player, transaction_index, show_time=True, time_str=time_str
             )
         
-        html.append('</tbody>')
-        html.append('</table>')
+        out(_TABLE_CLOSE)
     
     # Add JavaScript for toggling
-    html.append('''
-    <script>
-    function toggleTransaction(index) {
-        const details = document.getElementById('transaction-' + index);
-        const row = details.previousElementSibling;
-        if (details.classList.contains('expanded')) {
-            details.classList.remove('expanded');
-            row.classList.remove('expanded');
-        } else {
-            // Close all other expanded transactions
-            document.querySelectorAll('.transaction-details.expanded').forEach(el => {
-                el.classList.remove('expanded');
-                el.previousElementSibling.classList.remove('expanded');
-            });
-            details.classList.add('expanded');
-            row.classList.add('expanded');
-        }
-    }
-    </script>
-    ''')
+    out(_TRANSACTION_TOGGLE_JS)
     
-    return ''.join(html)
+    return ''.join(buf) if buf is not None else None
+
+
+def _partition_players(
+    players: Dict[str, int],
+    team1_id: int,
+    team2_id: Optional[int]
+) -> Tuple[List[str], List[str]]:
+    """
+    Split a player -> roster_id mapping into escaped name lists for two teams.
+    
+    Args:
+        players: Mapping of player name to roster ID (trade adds or drops)
+        team1_id: Roster ID of the first team
+        team2_id: Roster ID of the second team (players are only matched if truthy)
+        
+    Returns:
+        Tuple of (team1_players, team2_players); players on neither team are skipped
+    """
+    team1_players = []
+    team2_players = []
+    for player, rid in players.items():
+        if rid == team1_id:
+            team1_players.append(_escape_str(player))
+        elif team2_id and rid == team2_id:
+            team2_players.append(_escape_str(player))
+    return team1_players, team2_players
 
 
 def _generate_trade_row(
-    html: List[str],
+    out: Callable[[str], None],
     transaction: Dict,
     rosters_map: Dict[int, Dict[str, str]],
-    show_time: bool = False
+    show_time: bool = False,
+    time_str: Optional[str] = None
 ) -> None:
     """
     Generate a trade row showing both teams involved in the trade.
     
     Args:
-        html: List to append HTML to
+        out: Callback receiving HTML fragments
         transaction: Trade transaction dictionary
         rosters_map: Roster ID to team info mapping
         show_time: Whether to show the timestamp column
+        time_str: Preformatted creation time (formatted here if None)
     """
     adds = transaction.get('adds', {})
     drops = transaction.get('drops', {})
     roster_ids = transaction.get('roster_ids', [])
-    created = transaction.get('created')
-    time_str = format_timestamp(created) if show_time else ''
+    if time_str is None:
+        time_str = format_timestamp(transaction.get('created')) if show_time else ''
     
     if len(roster_ids) < 2:
         # Fallback if we don't have both teams
         team_name = escape_html(transaction.get('creator_team_name', 'Unknown'))
-        adds_list = [escape_html(player) for player in adds.keys()]
-        drops_list = [escape_html(player) for player in drops.keys()]
+        # JSON object keys are always strings, so the str fast path applies
+        adds_list = list(map(_escape_str, adds))
+        drops_list = list(map(_escape_str, drops))
         adds_str = ', '.join(adds_list) if adds_list else '—'
         drops_str = ', '.join(drops_list) if drops_list else '—'
         
-        html.append('<tr>')
-        html.append(f'<td colspan="3">{team_name}</td>')
-        html.append(f'<td>{adds_str}</td>')
-        html.append(f'<td>{drops_str}</td>')
-        if show_time:
-            html.append(f'<td class="time-cell">{time_str}</td>')
-        html.append('</tr>')
+        time_cell = f'<td class="time-cell">{time_str}</td>' if show_time else ''
+        out(f'<tr><td colspan="3">{team_name}</td><td>{adds_str}</td><td>{drops_str}</td>{time_cell}</tr>')
         return
     
     # Get team IDs
@@ -672,50 +717,42 @@ def _generate_trade_row(
         rosters_map.get(team2_id, {}).get('team_name', f'Team {team2_id}') if team2_id else 'Unknown'
     )
     
-    # Get team 1's adds and drops (players where the roster_id matches team1_id)
-    team1_adds = [escape_html(player) for player, rid in adds.items() if rid == team1_id]
-    team1_drops = [escape_html(player) for player, rid in drops.items() if rid == team1_id]
-    
-    # Get team 2's adds and drops
-    team2_adds = []
-    team2_drops = []
-    if team2_id:
-        team2_adds = [escape_html(player) for player, rid in adds.items() if rid == team2_id]
-        team2_drops = [escape_html(player) for player, rid in drops.items() if rid == team2_id]
+    # Split adds and drops between the two teams in one pass each
+    # (players where the roster_id matches that team's id)
+    team1_adds, team2_adds = _partition_players(adds, team1_id, team2_id)
+    team1_drops, team2_drops = _partition_players(drops, team1_id, team2_id)
     
     team1_adds_str = ', '.join(team1_adds) if team1_adds else '—'
     team1_drops_str = ', '.join(team1_drops) if team1_drops else '—'
     team2_adds_str = ', '.join(team2_adds) if team2_adds else '—'
     team2_drops_str = ', '.join(team2_drops) if team2_drops else '—'
     
-    html.append('<tr>')
-    html.append(f'<td><strong>{team1_name}</strong></td>')
-    html.append(f'<td>{team1_adds_str}</td>')
-    html.append(f'<td>{team1_drops_str}</td>')
-    html.append(f'<td><strong>{team2_name}</strong></td>')
-    html.append(f'<td>{team2_adds_str}</td>')
-    html.append(f'<td>{team2_drops_str}</td>')
-    if show_time:
-        html.append(f'<td class="time-cell">{time_str}</td>')
-    html.append('</tr>')
+    time_cell = f'<td class="time-cell">{time_str}</td>' if show_time else ''
+    out(
+        f'<tr><td><strong>{team1_name}</strong></td><td>{team1_adds_str}</td><td>{team1_drops_str}</td>'
+        f'<td><strong>{team2_name}</strong></td><td>{team2_adds_str}</td><td>{team2_drops_str}</td>'
+        f'{time_cell}</tr>'
+    )
 
 
 def _generate_transaction_row(
-    html: List[str],
+    out: Callable[[str], None],
     transaction: Dict,
     failed_by_player: Dict[str, List[Dict]],
     transaction_index: int,
-    show_time: bool = False
+    show_time: bool = False,
+    time_str: Optional[str] = None
 ) -> int:
     """
     Generate a single transaction row and its expandable details if needed.
     
     Args:
-        html: List to append HTML to
+        out: Callback receiving HTML fragments
         transaction: Transaction dictionary
         failed_by_player: Dictionary of failed claims grouped by player
         transaction_index: Current transaction index for unique IDs
         show_time: Whether to show the timestamp column
+        time_str: Preformatted creation time (formatted here if None)
         
     Returns:
         Updated transaction_index (incremented if expandable row was added)
@@ -723,24 +760,22 @@ def _generate_transaction_row(
     team_name = escape_html(transaction.get('creator_team_name', 'Unknown'))
     adds = transaction.get('adds', {})
     drops = transaction.get('drops', {})
-    created = transaction.get('created')
-    time_str = format_timestamp(created) if show_time else ''
+    if time_str is None:
+        time_str = format_timestamp(transaction.get('created')) if show_time else ''
     
-    # Format adds and drops (use original player names, not escaped, for lookup)
-    adds_list_original = list(adds.keys())
-    adds_list = [escape_html(player) for player in adds_list_original]
-    drops_list = [escape_html(player) for player in drops.keys()]
+    # Format adds and drops
+    adds_list = list(map(_escape_str, adds))
+    drops_list = list(map(_escape_str, drops))
     adds_str = ', '.join(adds_list) if adds_list else '—'
     drops_str = ', '.join(drops_list) if drops_list else '—'
     
-    # Check if any of the added players have failed claims (only for waivers)
-    has_failed_claims = False
+    # Check if any of the added players have failed claims (only for waivers).
+    # isdisjoint runs in C and rules out most rows before any per-player work;
+    # lookups use the original player names, not escaped ones.
     failed_claims_players = []
-    if transaction.get('type') == 'waiver':
-        for player_original in adds_list_original:
-            if player_original in failed_by_player:
-                has_failed_claims = True
-                failed_claims_players.append(player_original)
+    if transaction.get('type') == 'waiver' and not failed_by_player.keys().isdisjoint(adds):
+        failed_claims_players = [player for player in adds if player in failed_by_player]
+    has_failed_claims = bool(failed_claims_players)
     
     # Main transaction row
     row_class = 'transaction-row'
@@ -750,50 +785,44 @@ def _generate_transaction_row(
     else:
         onclick = ''
     
-    html.append(f'<tr class="{row_class}" onclick="{onclick}">')
-    html.append(f'<td>{team_name}</td>')
-    html.append(f'<td>{adds_str}</td>')
-    html.append(f'<td>{drops_str}</td>')
-    if show_time:
-        html.append(f'<td class="time-cell">{time_str}</td>')
+    time_cell = f'<td class="time-cell">{time_str}</td>' if show_time else ''
     if has_failed_claims:
-        html.append(f'<td><span class="expand-icon">▶</span></td>')
+        expand_cell = '<td><span class="expand-icon">▶</span></td>'
     elif show_time:
-        html.append('<td></td>')
-    html.append('</tr>')
+        expand_cell = '<td></td>'
+    else:
+        expand_cell = ''
+    out(
+        f'<tr class="{row_class}" onclick="{onclick}"><td>{team_name}</td>'
+        f'<td>{adds_str}</td><td>{drops_str}</td>{time_cell}{expand_cell}</tr>'
+    )
     
     # Expandable failed claims row
     if has_failed_claims:
-        html.append(f'<tr class="transaction-details" id="transaction-{transaction_index}">')
         colspan = 5 if show_time else 4
-        html.append(f'<td colspan="{colspan}">')
-        html.append('<div class="transaction-details-content">')
-        html.append('<h4>Failed Claims for This Player</h4>')
+        out(
+            f'<tr class="transaction-details" id="transaction-{transaction_index}">'
+            f'<td colspan="{colspan}"><div class="transaction-details-content">'
+            '<h4>Failed Claims for This Player</h4>'
+        )
         
         for player_original in failed_claims_players:
             failed_claims = failed_by_player[player_original]
-            html.append(f'<div class="failed-claims-group">')
-            html.append(f'<h5>{escape_html(player_original)}</h5>')
-            html.append('<ul class="failed-claims-list">')
+            out(
+                f'<div class="failed-claims-group"><h5>{escape_html(player_original)}</h5>'
+                '<ul class="failed-claims-list">'
+            )
             
             for failed_claim in failed_claims:
                 failed_team = escape_html(failed_claim.get('creator_team_name', 'Unknown'))
                 failed_drops = failed_claim.get('drops', {})
-                failed_drops_list = [escape_html(p) for p in failed_drops.keys()]
-                failed_drops_str = ', '.join(failed_drops_list) if failed_drops_list else 'None'
-                
-                html.append('<li>')
-                html.append(f'<strong>{failed_team}</strong>')
-                if failed_drops_str != 'None':
-                    html.append(f' (dropped: {failed_drops_str})')
-                html.append('</li>')
+                # Join the drops directly instead of round-tripping through a 'None' placeholder
+                dropped = f' (dropped: {", ".join(map(_escape_str, failed_drops))})' if failed_drops else ''
+                out(f'<li><strong>{failed_team}</strong>{dropped}</li>')
             
-            html.append('</ul>')
-            html.append('</div>')
+            out('</ul></div>')
         
-        html.append('</div>')
-        html.append('</td>')
-        html.append('</tr>')
+        out('</div></td></tr>')
         
         transaction_index += 1
     
@@ -827,28 +856,29 @@ def generate_weekly_html(
     nav = get_navigation(season=season, week=week, prev_week=prev_week, next_week=next_week)
     breadcrumb = get_breadcrumb(season=season, week=week)
     
-    # Content
+    # Content (section builders append their fragments directly)
     content_parts = [breadcrumb]
-    content_parts.append(f'<h1>Week {week} Recap - {season} Season</h1>')
+    emit = content_parts.append
+    emit(f'<h1>Week {week} Recap - {season} Season</h1>')
     
     # Matchups
     matchups = recap_data.get('matchups', [])
     if matchups:
-        content_parts.append(generate_matchup_table(matchups))
+        generate_matchup_table(matchups, out=emit)
     
     # Transactions
     if transactions:
-        content_parts.append(generate_transactions_table(transactions, season=season))
+        generate_transactions_table(transactions, season=season, out=emit)
     
     # Standings
     standings = recap_data.get('standings', [])
     if standings:
-        content_parts.append(generate_standings_table(standings))
+        generate_standings_table(standings, out=emit)
     
     # Awards
     awards = recap_data.get('awards', {})
     if awards:
-        content_parts.append(generate_awards_section(awards))
+        generate_awards_section(awards, out=emit)
     
     # Team Highlights
     content_parts.append('<h2>Team Highlights</h2>')
@@ -873,13 +903,7 @@ def generate_weekly_html(
     if benchwarmers:
         content_parts.append(generate_team_highlight(benchwarmers, '🔥 Benchwarmers (Best Bench Lineup)'))
     
-    content = ''.join(content_parts)
-    
-    # Generate full HTML
-    html = get_html_template(title, nav, content)
-    
-    # Write to file
+    # Stream the page to disk fragment by fragment instead of joining it first
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    write_text_atomic(output_path, iter_html_template(title, nav, content_parts))
 
@@ -1,10 +1,41 @@
 """Standings calculator for cumulative weekly standings."""
 import json
 from pathlib import Path
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple
 
-from utils.matchup_utils import group_matchups_by_id
-from utils.json_utils import load_json
+from utils.matchup_utils import iter_matchup_pairs
+from utils.json_utils import load_json_cached
+
+# Cumulative standings keyed by (season_dir, week), so each week builds on the
+# previous week's result instead of replaying the season from week 1
+_standings_cache: Dict[Tuple[str, int], Dict[int, Dict]] = {}
+
+_standings_sort_key = itemgetter('win_pct', 'pf')
+
+
+def clear_standings_cache() -> None:
+    """
+    Drop all memoized cumulative standings.
+    
+    Call this when a season's raw data may have changed (e.g., after a re-fetch).
+    """
+    _standings_cache.clear()
+
+
+def _copy_standings(standings: Dict[int, Dict]) -> Dict[int, Dict]:
+    """
+    Copy a standings dictionary so the copy can be updated independently.
+    
+    Args:
+        standings: Dictionary of standings keyed by roster_id
+        
+    Returns:
+        New dictionary with a fresh stats dict per roster
+    """
+    # Stats values are immutable scalars, so a shallow dict.copy() per roster is a
+    # full copy and runs in C instead of rebuilding each field by name
+    return {roster_id: stats.copy() for roster_id, stats in standings.items()}
 
 
 def _process_week_data(
@@ -28,53 +59,54 @@ def _process_week_data(
         return
     
     # Process matchups to update W-L and points
-    matchups = load_json(matchups_path)
+    # data_processor has usually just read this week's files; reuse that read
+    matchups = load_json_cached(matchups_path)
     if matchups is None:
         return
     
-    # Group matchups by matchup_id
-    matchup_groups = group_matchups_by_id(matchups)
-    
-    # Determine wins/losses for each matchup
-    for matchup_id, matchup_list in matchup_groups.items():
-        if len(matchup_list) == 2:
-            team1 = matchup_list[0]
-            team2 = matchup_list[1]
+    # Determine wins/losses for each head-to-head matchup
+    for team1, team2 in iter_matchup_pairs(matchups):
+        roster_id1 = team1.get('roster_id')
+        roster_id2 = team2.get('roster_id')
+        points1 = team1.get('points', 0.0)
+        points2 = team2.get('points', 0.0)
+        
+        if roster_id1 and roster_id2:
+            # Resolve each team's row once rather than per field update
+            stats1 = standings[roster_id1]
+            stats2 = standings[roster_id2]
             
-            roster_id1 = team1.get('roster_id')
-            roster_id2 = team2.get('roster_id')
-            points1 = team1.get('points', 0.0)
-            points2 = team2.get('points', 0.0)
+            # Update points for and against
+            stats1['pf'] += points1
+            stats1['pa'] += points2
+            stats2['pf'] += points2
+            stats2['pa'] += points1
             
-            if roster_id1 and roster_id2:
-                # Update points for and against
-                standings[roster_id1]['pf'] += points1
-                standings[roster_id1]['pa'] += points2
-                standings[roster_id2]['pf'] += points2
-                standings[roster_id2]['pa'] += points1
-                
-                # Update W-L record
-                if points1 > points2:
-                    standings[roster_id1]['wins'] += 1
-                    standings[roster_id2]['losses'] += 1
-                elif points2 > points1:
-                    standings[roster_id1]['losses'] += 1
-                    standings[roster_id2]['wins'] += 1
-                else:
-                    standings[roster_id1]['ties'] += 1
-                    standings[roster_id2]['ties'] += 1
+            # Update W-L record
+            if points1 > points2:
+                stats1['wins'] += 1
+                stats2['losses'] += 1
+            elif points2 > points1:
+                stats1['losses'] += 1
+                stats2['wins'] += 1
+            else:
+                stats1['ties'] += 1
+                stats2['ties'] += 1
     
     # Process transactions to count them
-    transactions = load_json(transactions_path)
-    if transactions is not None:
+    transactions = load_json_cached(transactions_path)
+    if transactions:
+        # Only count complete transactions; failed waiver claims are often the majority
+        complete = [t for t in transactions if t.get('status') == 'complete']
+        if not complete:
+            return
         
-        for transaction in transactions:
-            # Only count complete transactions
-            if transaction.get('status') == 'complete':
-                roster_ids = transaction.get('roster_ids', [])
-                for roster_id in roster_ids:
-                    if roster_id in standings:
-                        standings[roster_id]['transaction_count'] += 1
+        # A keys view supports the same O(1) membership test without copying
+        valid = standings.keys()
+        for transaction in complete:
+            for roster_id in transaction.get('roster_ids', []):
+                if roster_id in valid:
+                    standings[roster_id]['transaction_count'] += 1
 
 
 def _initialize_standings(rosters_map: Dict[int, Dict[str, str]]) -> Dict[int, Dict]:
@@ -102,15 +134,17 @@ def _initialize_standings(rosters_map: Dict[int, Dict[str, str]]) -> Dict[int, D
     return standings
 
 
-def standings_to_list(standings: Dict[int, Dict]) -> List[Dict]:
+def standings_to_list(standings: Dict[int, Dict], *, sort: bool = True) -> List[Dict]:
     """
     Convert standings dictionary to sorted list.
     
     Args:
         standings: Dictionary of standings keyed by roster_id
+        sort: Whether to sort the list; pass False when only the rows are needed
         
     Returns:
         List of standings dictionaries, sorted by win percentage (desc), then PF (desc)
+        (in roster order when sort is False)
     """
     standings_list = []
     for roster_id, stats in standings.items():
@@ -133,7 +167,8 @@ def standings_to_list(standings: Dict[int, Dict]) -> List[Dict]:
         })
     
     # Sort by win percentage (desc), then PF (desc)
-    standings_list.sort(key=lambda x: (x['win_pct'], x['pf']), reverse=True)
+    if sort:
+        standings_list.sort(key=_standings_sort_key, reverse=True)
     
     return standings_list
 
@@ -168,6 +203,50 @@ def calculate_weekly_standings(
     return standings_to_list(standings_dict)
 
 
+def _cached_weekly_standings(
+    season_dir: Path,
+    week: int,
+    rosters_map: Dict[int, Dict[str, str]],
+    previous_standings: Optional[Dict[int, Dict]] = None
+) -> Dict[int, Dict]:
+    """
+    Calculate (or fetch memoized) cumulative standings through a week.
+    
+    The returned dictionary is the cache entry itself; only this module reads
+    it directly, and calculate_weekly_standings_dict hands callers a copy.
+    
+    Args:
+        season_dir: Path to season directory (e.g., src/data/unmunged/2024)
+        week: Week number to calculate standings for
+        rosters_map: Roster ID to user info mapping
+        previous_standings: Optional standings through week-1 to increment from
+        
+    Returns:
+        Shared dictionary of standings keyed by roster_id
+    """
+    cache_key = (str(season_dir), week)
+    cached = _standings_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    if previous_standings is None and week > 1:
+        # Build on the (memoized) standings through the previous week
+        previous_standings = _cached_weekly_standings(season_dir, week - 1, rosters_map)
+    
+    if previous_standings is None:
+        standings = _initialize_standings(rosters_map)
+    else:
+        # Copy previous standings to avoid mutating the original (or the cache)
+        standings = _copy_standings(previous_standings)
+    
+    # previous_standings already has weeks 1 to week-1, so only process this week
+    if week >= 1:
+        _process_week_data(season_dir, week, standings)
+    
+    _standings_cache[cache_key] = standings
+    return standings
+
+
 def calculate_weekly_standings_dict(
     season_dir: Path,
     week: int,
@@ -178,6 +257,9 @@ def calculate_weekly_standings_dict(
     Calculate cumulative standings up to and including the specified week.
     Returns the standings dictionary (for caching) instead of a list.
     
+    Results are memoized per (season_dir, week). Callers get their own copy,
+    so changing the returned standings never affects later weeks.
+    
     Args:
         season_dir: Path to season directory (e.g., src/data/unmunged/2024)
         week: Week number to calculate standings for
@@ -192,32 +274,9 @@ def calculate_weekly_standings_dict(
         FileNotFoundError: If required matchup files don't exist
         json.JSONDecodeError: If JSON files are invalid
     """
-    # Initialize or copy previous standings
-    if previous_standings is None:
-        standings = _initialize_standings(rosters_map)
-        # Process all weeks from 1 to week
-        for w in range(1, week + 1):
-            _process_week_data(season_dir, w, standings)
-    else:
-        # Deep copy previous standings to avoid mutating the original
-        # Use dict comprehension for better performance
-        standings = {
-            roster_id: {
-                'roster_id': stats['roster_id'],
-                'team_name': stats['team_name'],
-                'wins': stats['wins'],
-                'losses': stats['losses'],
-                'ties': stats['ties'],
-                'pf': stats['pf'],
-                'pa': stats['pa'],
-                'transaction_count': stats['transaction_count']
-            }
-            for roster_id, stats in previous_standings.items()
-        }
-        # Process only the current week (previous_standings already has weeks 1 to week-1)
-        _process_week_data(season_dir, week, standings)
-    
-    return standings
+    return _copy_standings(
+        _cached_weekly_standings(season_dir, week, rosters_map, previous_standings)
+    )
 
 
 def get_matchup_results(matchups: List[Dict]) -> Dict[int, Tuple[int, int, float, float]]:
@@ -230,31 +289,24 @@ def get_matchup_results(matchups: List[Dict]) -> Dict[int, Tuple[int, int, float
     Returns:
         Dictionary mapping roster_id to (opponent_roster_id, won, points, opponent_points)
     """
-    # Reuse the existing grouping function instead of duplicating logic
-    matchup_groups = group_matchups_by_id(matchups)
-    
     results = {}
-    for matchup_id, matchup_list in matchup_groups.items():
-        if len(matchup_list) == 2:
-            team1 = matchup_list[0]
-            team2 = matchup_list[1]
-            
-            roster_id1 = team1.get('roster_id')
-            roster_id2 = team2.get('roster_id')
-            points1 = team1.get('points', 0.0)
-            points2 = team2.get('points', 0.0)
+    for team1, team2 in iter_matchup_pairs(matchups):
+        roster_id1 = team1.get('roster_id')
+        roster_id2 = team2.get('roster_id')
+        points1 = team1.get('points', 0.0)
+        points2 = team2.get('points', 0.0)
+        
+        if roster_id1 and roster_id2:
+            # 1 = win, 0 = loss, -1 = tie
+            if points1 > points2:
+                won1, won2 = 1, 0
+            elif points2 > points1:
+                won1, won2 = 0, 1
+            else:
+                won1 = won2 = -1
             
-            if roster_id1 and roster_id2:
-                # 1 = win, 0 = loss, -1 = tie
-                if points1 > points2:
-                    results[roster_id1] = (roster_id2, 1, points1, points2)
-                    results[roster_id2] = (roster_id1, 0, points2, points1)
-                elif points2 > points1:
-                    results[roster_id1] = (roster_id2, 0, points1, points2)
-                    results[roster_id2] = (roster_id1, 1, points2, points1)
-                else:
-                    results[roster_id1] = (roster_id2, -1, points1, points2)
-                    results[roster_id2] = (roster_id1, -1, points2, points1)
+            results[roster_id1] = (roster_id2, won1, points1, points2)
+            results[roster_id2] = (roster_id1, won2, points2, points1)
     
     return results
 
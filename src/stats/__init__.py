@@ -1,5 +1,7 @@
 """Statistics package for all-time manager statistics."""
 
+from .data_collector import collect_all_season_data
+from .score_collectors import collect_high_scores
 from .csv_generators import (
     generate_all_time_standings_csv,
     generate_head_to_head_csv,
@@ -8,6 +10,8 @@ from .csv_generators import (
 )
 
 __all__ = [
+    'collect_all_season_data',
+    'collect_high_scores',
     'generate_all_time_standings_csv',
     'generate_head_to_head_csv',
     'generate_weekly_high_scores_csv',
@@ -1,36 +1,108 @@
 """CSV generation functions for all-time statistics."""
 import csv
+import io
+from heapq import nlargest
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from constants import ALL_TIME_HIGH_SCORES_COUNT
 from stats.data_collector import collect_all_season_data
-from stats.statistics_calculator import (
-    calculate_manager_stats,
-    calculate_lucky_unlucky_and_extremes
-)
+from stats.statistics_calculator import calculate_manager_stats
 from stats.h2h_records import build_head_to_head_records
 from stats.score_collectors import (
+    PlayerScore,
+    WeeklyScore,
     collect_weekly_high_scores,
     collect_player_high_scores
 )
+from utils.file_utils import write_text_atomic
 from utils.logging_utils import get_logger
 
 logger = get_logger('stats.csv_generators')
 
+# (points, year, week) cells in the standings CSV, e.g. "152.34 (2023 Wk7)"
+_SCORE_FMT = '{0:.2f} ({1} Wk{2})'
+_EMPTY_SCORE = '0.00 ()'
+
+_get_points = attrgetter('points')
+
+# (stats_by_user, user_id_to_display_name) as returned by collect_all_season_data
+SeasonData = Tuple[Dict[str, Dict], Dict[str, str]]
+
+
+def _standings_rows(manager_stats: List[Dict]) -> Iterator[List]:
+    """
+    Yield all-time standings CSV rows, one per manager.
+    
+    Args:
+        manager_stats: Sorted list of manager statistics dictionaries
+        
+    Yields:
+        CSV row values for each manager
+    """
+    format_score = _SCORE_FMT.format
+    
+    for idx, stats in enumerate(manager_stats, 1):
+        h2h_record = f"{stats['wins']}-{stats['losses']}"
+        
+        high_score_str = format_score(*stats['high_score'])
+        low_score_str = format_score(*stats['low_score'])
+        
+        # Win/loss extremes carry an empty year when the manager has no such games
+        largest_win_str = format_score(*stats['largest_win']) if stats['largest_win'][1] else _EMPTY_SCORE
+        smallest_win_str = format_score(*stats['smallest_win']) if stats['smallest_win'][1] else _EMPTY_SCORE
+        
+        largest_loss_str = format_score(*stats['largest_loss']) if stats['largest_loss'][1] else _EMPTY_SCORE
+        smallest_loss_str = format_score(*stats['smallest_loss']) if stats['smallest_loss'][1] else _EMPTY_SCORE
+        
+        yield [
+            idx,
+            stats['display_name'],
+            stats['seasons'],
+            stats['games_played'],
+            h2h_record,
+            f"{stats['win_pct']:.1f}%",
+            f"{stats['total_pf']:.2f}",
+            f"{stats['avg_pf']:.2f}",
+            f"{stats['total_pa']:.2f}",
+            f"{stats['avg_pa']:.2f}",
+            f"{stats['avg_margin']:.2f}",
+            f"{stats['avg_win_margin']:.2f}",
+            f"{stats['avg_loss_margin']:.2f}",
+            high_score_str,
+            low_score_str,
+            largest_win_str,
+            smallest_win_str,
+            largest_loss_str,
+            smallest_loss_str,
+            f"{stats['median_win_pct']:.1f}%",
+            stats['unlucky_losses'],
+            stats['lucky_wins'],
+            f"{stats['points_stdev']:.2f}",
+            stats['top_score_weeks'],
+            stats['low_score_weeks']
+        ]
+
 
-def generate_all_time_standings_csv(unmunged_dir: Path, output_path: Path) -> None:
+def generate_all_time_standings_csv(
+    unmunged_dir: Path,
+    output_path: Path,
+    season_data: Optional[SeasonData] = None
+) -> None:
     """
     Generate all-time standings CSV file.
     
     Args:
         unmunged_dir: Path to unmunged directory (e.g., src/data/unmunged)
         output_path: Path to output CSV file (e.g., src/data/munged/all_time/standings.csv)
+        season_data: Optional result of collect_all_season_data to reuse instead of
+                     re-walking every season (shared with generate_head_to_head_csv)
     """
-    logger.info("Collecting all-time statistics...")
-    stats_by_user, user_id_to_display_name = collect_all_season_data(unmunged_dir)
-    
-    logger.info("Calculating lucky/unlucky and extreme weeks...")
-    calculate_lucky_unlucky_and_extremes(stats_by_user, unmunged_dir)
+    if season_data is None:
+        logger.info("Collecting all-time statistics...")
+        season_data = collect_all_season_data(unmunged_dir)
+    stats_by_user, user_id_to_display_name = season_data
     
     logger.info("Calculating manager statistics...")
     manager_stats = []
@@ -55,72 +127,71 @@ def generate_all_time_standings_csv(unmunged_dir: Path, output_path: Path) -> No
             manager_stats.append(stats)
     
     # Sort by win percentage (desc), then total PF (desc)
-    manager_stats.sort(key=lambda x: (x['win_pct'], x['total_pf']), reverse=True)
+    manager_stats.sort(key=itemgetter('win_pct', 'total_pf'), reverse=True)
     
     # Write CSV
     logger.info(f"Writing CSV to {output_path}...")
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w', newline='') as f:
-        writer = csv.writer(f)
-        
-        # Write header
-        writer.writerow([
-            '#', 'Manager', 'Seasons', 'Games Played', 'H2H Record (W-L)', 'H2H Win %',
-            'Total PF', 'Avg PF', 'Total PA', 'Avg PA', 'Avg Margin',
-            'Avg Win Margin', 'Avg Loss Margin', 'High Score', 'Low Score',
-            'Largest Win', 'Smallest Win', 'Largest Loss', 'Smallest Loss',
-            'Median Win %', 'Unlucky Losses', 'Lucky Wins',
-            'Points StDev', 'Top Score Weeks', 'Low Score Weeks'
-        ])
-        
-        # Write data rows
-        for idx, stats in enumerate(manager_stats, 1):
-            h2h_record = f"{stats['wins']}-{stats['losses']}"
-            
-            high_score_str = f"{stats['high_score'][0]:.2f} ({stats['high_score'][1]} Wk{stats['high_score'][2]})"
-            low_score_str = f"{stats['low_score'][0]:.2f} ({stats['low_score'][1]} Wk{stats['low_score'][2]})"
-            
-            largest_win_str = f"{stats['largest_win'][0]:.2f} ({stats['largest_win'][1]} Wk{stats['largest_win'][2]})" if stats['largest_win'][1] else "0.00 ()"
-            smallest_win_str = f"{stats['smallest_win'][0]:.2f} ({stats['smallest_win'][1]} Wk{stats['smallest_win'][2]})" if stats['smallest_win'][1] else "0.00 ()"
-            
-            largest_loss_str = f"{stats['largest_loss'][0]:.2f} ({stats['largest_loss'][1]} Wk{stats['largest_loss'][2]})" if stats['largest_loss'][1] else "0.00 ()"
-            smallest_loss_str = f"{stats['smallest_loss'][0]:.2f} ({stats['smallest_loss'][1]} Wk{stats['smallest_loss'][2]})" if stats['smallest_loss'][1] else "0.00 ()"
-            
-            writer.writerow([
-                idx,
-                stats['display_name'],
-                stats['seasons'],
-                stats['games_played'],
-                h2h_record,
-                f"{stats['win_pct']:.1f}%",
-                f"{stats['total_pf']:.2f}",
-                f"{stats['avg_pf']:.2f}",
-                f"{stats['total_pa']:.2f}",
-                f"{stats['avg_pa']:.2f}",
-                f"{stats['avg_margin']:.2f}",
-                f"{stats['avg_win_margin']:.2f}",
-                f"{stats['avg_loss_margin']:.2f}",
-                high_score_str,
-                low_score_str,
-                largest_win_str,
-                smallest_win_str,
-                largest_loss_str,
-                smallest_loss_str,
-                f"{stats['median_win_pct']:.1f}%",
-                stats['unlucky_losses'],
-                stats['lucky_wins'],
-                f"{stats['points_stdev']:.2f}",
-                stats['top_score_weeks'],
-                stats['low_score_weeks']
-            ])
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    
+    # Write header
+    writer.writerow([
+        '#', 'Manager', 'Seasons', 'Games Played', 'H2H Record (W-L)', 'H2H Win %',
+        'Total PF', 'Avg PF', 'Total PA', 'Avg PA', 'Avg Margin',
+        'Avg Win Margin', 'Avg Loss Margin', 'High Score', 'Low Score',
+        'Largest Win', 'Smallest Win', 'Largest Loss', 'Smallest Loss',
+        'Median Win %', 'Unlucky Losses', 'Lucky Wins',
+        'Points StDev', 'Top Score Weeks', 'Low Score Weeks'
+    ])
+    
+    # Write data rows (csv drives the loop over the generator)
+    writer.writerows(_standings_rows(manager_stats))
+    
+    # Rows were buffered in memory; write the whole file atomically in one go
+    write_text_atomic(output_path, (buf.getvalue(),), newline='')
     
     logger.info(f"All-time standings CSV generated successfully!")
 
 
+def _head_to_head_rows(
+    all_user_ids: List[str],
+    h2h_records: Dict[str, Dict[str, Tuple[int, int]]],
+    user_id_to_display_name: Dict[str, str]
+) -> Iterator[List[str]]:
+    """
+    Yield head-to-head matrix CSV rows, one per manager.
+    
+    Args:
+        all_user_ids: User IDs in row/column order
+        h2h_records: Nested mapping of user_id -> opponent user_id -> (wins, losses)
+        user_id_to_display_name: User ID to display name mapping
+        
+    Yields:
+        CSV row values for each manager
+    """
+    for row_user_id in all_user_ids:
+        row_name = user_id_to_display_name.get(row_user_id, row_user_id)
+        row_data = [row_name]
+        row_records = h2h_records.get(row_user_id, {})
+        
+        for col_user_id in all_user_ids:
+            if row_user_id == col_user_id:
+                # Diagonal: no self-competition
+                row_data.append('—')
+            else:
+                # Get head-to-head record
+                wins, losses = row_records.get(col_user_id, (0, 0))
+                row_data.append(f"{wins}-{losses}")
+        
+        yield row_data
+
+
 def generate_head_to_head_csv(
     unmunged_dir: Path,
-    output_path: Path
+    output_path: Path,
+    season_data: Optional[SeasonData] = None
 ) -> None:
     """
     Generate head-to-head record matrix CSV file.
@@ -128,9 +199,13 @@ def generate_head_to_head_csv(
     Args:
         unmunged_dir: Path to unmunged directory (e.g., src/data/unmunged)
         output_path: Path to output CSV file (e.g., src/data/munged/all_time/head_to_head.csv)
+        season_data: Optional result of collect_all_season_data to reuse instead of
+                     re-walking every season
     """
-    logger.info("Collecting all-time statistics for head-to-head records...")
-    stats_by_user, user_id_to_display_name = collect_all_season_data(unmunged_dir)
+    if season_data is None:
+        logger.info("Collecting all-time statistics for head-to-head records...")
+        season_data = collect_all_season_data(unmunged_dir)
+    stats_by_user, user_id_to_display_name = season_data
     
     logger.info("Building head-to-head records...")
     h2h_records = build_head_to_head_records(stats_by_user)
@@ -145,105 +220,106 @@ def generate_head_to_head_csv(
     logger.info(f"Writing head-to-head CSV to {output_path}...")
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w', newline='') as f:
-        writer = csv.writer(f)
-        
-        # Write header row
-        header = [''] + [user_id_to_display_name.get(uid, uid) for uid in all_user_ids]
-        writer.writerow(header)
-        
-        # Write data rows
-        for row_user_id in all_user_ids:
-            row_name = user_id_to_display_name.get(row_user_id, row_user_id)
-            row_data = [row_name]
-            
-            for col_user_id in all_user_ids:
-                if row_user_id == col_user_id:
-                    # Diagonal: no self-competition
-                    row_data.append('—')
-                else:
-                    # Get head-to-head record
-                    wins, losses = h2h_records.get(row_user_id, {}).get(col_user_id, (0, 0))
-                    row_data.append(f"{wins}-{losses}")
-            
-            writer.writerow(row_data)
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    
+    # Write header row
+    header = [''] + [user_id_to_display_name.get(uid, uid) for uid in all_user_ids]
+    writer.writerow(header)
+    
+    # Write data rows
+    writer.writerows(_head_to_head_rows(all_user_ids, h2h_records, user_id_to_display_name))
+    
+    # Rows were buffered in memory; write the whole file atomically in one go
+    write_text_atomic(output_path, (buf.getvalue(),), newline='')
     
     logger.info(f"Head-to-head CSV generated successfully!")
 
 
-def generate_weekly_high_scores_csv(munged_dir: Path, output_path: Path) -> None:
+def generate_weekly_high_scores_csv(
+    munged_dir: Path,
+    output_path: Path,
+    weekly_scores: Optional[List[WeeklyScore]] = None
+) -> None:
     """
     Generate CSV file with top 10 all-time weekly high scores.
     
     Args:
         munged_dir: Path to munged directory (e.g., src/data/munged)
         output_path: Path to output CSV file
+        weekly_scores: Optional weekly scores from collect_high_scores to reuse instead
+            of re-reading every recap
     """
-    logger.info("Collecting all weekly high scores...")
-    weekly_scores = collect_weekly_high_scores(munged_dir)
+    if weekly_scores is None:
+        logger.info("Collecting all weekly high scores...")
+        weekly_scores = collect_weekly_high_scores(munged_dir, ALL_TIME_HIGH_SCORES_COUNT)
     
-    # Sort by points descending and take top 10
-    weekly_scores.sort(key=lambda x: x['points'], reverse=True)
-    top_10 = weekly_scores[:10]
+    # Top scores by points descending (without reordering the caller's list);
+    # nlargest is stable, so ties keep collection order
+    top_scores = nlargest(ALL_TIME_HIGH_SCORES_COUNT, weekly_scores, key=_get_points)
     
     # Write CSV
     logger.info(f"Writing weekly high scores CSV to {output_path}...")
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w', newline='') as f:
-        writer = csv.writer(f)
-        
-        # Write header
-        writer.writerow(['#', 'Points', 'Year', 'Week', 'Team'])
-        
-        # Write data rows
-        for idx, score in enumerate(top_10, 1):
-            writer.writerow([
-                idx,
-                f"{score['points']:.2f}",
-                score['year'],
-                score['week'],
-                score['team_name']
-            ])
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    
+    # Write header
+    writer.writerow(['#', 'Points', 'Year', 'Week', 'Team'])
+    
+    # Write data rows
+    writer.writerows(
+        [idx, f"{score.points:.2f}", score.year, score.week, score.team_name]
+        for idx, score in enumerate(top_scores, 1)
+    )
+    
+    # Rows were buffered in memory; write the whole file atomically in one go
+    write_text_atomic(output_path, (buf.getvalue(),), newline='')
     
     logger.info(f"Weekly high scores CSV generated successfully!")
 
 
-def generate_player_high_scores_csv(munged_dir: Path, output_path: Path) -> None:
+def generate_player_high_scores_csv(
+    munged_dir: Path,
+    output_path: Path,
+    player_scores: Optional[List[PlayerScore]] = None
+) -> None:
     """
     Generate CSV file with top 10 all-time player high scores.
     
     Args:
         munged_dir: Path to munged directory (e.g., src/data/munged)
         output_path: Path to output CSV file
+        player_scores: Optional player scores from collect_high_scores to reuse instead
+            of re-reading every recap
     """
-    logger.info("Collecting all player high scores...")
-    player_scores = collect_player_high_scores(munged_dir)
+    if player_scores is None:
+        logger.info("Collecting all player high scores...")
+        player_scores = collect_player_high_scores(munged_dir, ALL_TIME_HIGH_SCORES_COUNT)
     
-    # Sort by points descending and take top 10
-    player_scores.sort(key=lambda x: x['points'], reverse=True)
-    top_10 = player_scores[:10]
+    # Top scores by points descending (without reordering the caller's list);
+    # nlargest is stable, so ties keep collection order
+    top_scores = nlargest(ALL_TIME_HIGH_SCORES_COUNT, player_scores, key=_get_points)
     
     # Write CSV
     logger.info(f"Writing player high scores CSV to {output_path}...")
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w', newline='') as f:
-        writer = csv.writer(f)
-        
-        # Write header
-        writer.writerow(['#', 'Points', 'Player', 'Year', 'Week', 'Team'])
-        
-        # Write data rows
-        for idx, score in enumerate(top_10, 1):
-            writer.writerow([
-                idx,
-                f"{score['points']:.2f}",
-                score['player_name'],
-                score['year'],
-                score['week'],
-                score['team_name']
-            ])
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    
+    # Write header
+    writer.writerow(['#', 'Points', 'Player', 'Year', 'Week', 'Team'])
+    
+    # Write data rows
+    writer.writerows(
+        [idx, f"{score.points:.2f}", score.player_name, score.year, score.week, score.team_name]
+        for idx, score in enumerate(top_scores, 1)
+    )
+    
+    # Rows were buffered in memory; write the whole file atomically in one go
+    write_text_atomic(output_path, (buf.getvalue(),), newline='')
     
     logger.info(f"Player high scores CSV generated successfully!")
 
@@ -1,24 +1,98 @@
 """Data collection functions for all-time statistics."""
-import statistics
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 from constants import DEFAULT_PLAYOFF_WEEK_START
-from mappers import load_users_map, load_rosters_map
-from utils.matchup_utils import group_matchups_by_id
+from mappers import load_users_map
+from utils.matchup_utils import iter_matchup_pairs
+from utils.file_utils import get_season_directories
 from utils.json_utils import load_json
 from utils.logging_utils import get_logger
+from utils.parallel_utils import map_seasons
 
 logger = get_logger('stats.data_collector')
 
 
+class Game(NamedTuple):
+    """One manager's side of a regular-season matchup."""
+    year: str
+    week: int
+    points: float
+    opponent_points: float
+    won: bool
+    margin: float
+    opponent_user_id: str
+
+
+class GameLog:
+    """
+    A manager's games stored column-wise: one list per Game field.
+    
+    Stats read whole columns (e.g. every game's points) far more often than
+    whole games, so each column is a contiguous list that sum()/statistics
+    can consume directly instead of pulling one attribute off every game.
+    """
+    __slots__ = Game._fields
+    
+    def __init__(self) -> None:
+        for field in Game._fields:
+            setattr(self, field, [])
+    
+    def __len__(self) -> int:
+        return len(self.points)
+    
+    def __iter__(self):
+        """Yield the log's games as Game tuples, in insertion order."""
+        return map(Game._make, zip(*(getattr(self, field) for field in Game._fields)))
+    
+    def extend(self, games: Iterable[Game]) -> None:
+        """
+        Append games to the end of the log.
+        
+        Args:
+            games: Game tuples to append
+        """
+        # zip(*games) transposes the rows into columns (nothing for no games)
+        for field, values in zip(Game._fields, zip(*games)):
+            getattr(self, field).extend(values)
+    
+    def merge(self, other: 'GameLog') -> None:
+        """
+        Append every game of another log to the end of this one.
+        
+        Args:
+            other: Log whose games are appended
+        """
+        for field in Game._fields:
+            getattr(self, field).extend(getattr(other, field))
+
+
+def sorted_median(ordered: List[float]) -> float:
+    """
+    Median of an already sorted, non-empty list of scores.
+    
+    Same result as statistics.median (middle value, or the mean of the two
+    middle values), without its type checks and second sort.
+    
+    Args:
+        ordered: Scores in ascending order
+        
+    Returns:
+        Median score
+    """
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[mid]
+    return (ordered[mid - 1] + ordered[mid]) / 2
+
+
 def process_week_matchups(
     matchups: List[Dict],
     roster_to_user: Dict[int, str],
     year: str,
     week: int
-) -> Tuple[Dict[str, List[Dict]], float]:
+) -> Tuple[Dict[str, List[Game]], float]:
     """
     Process matchups for a week and return game data by user_id and weekly median.
     
@@ -28,73 +102,103 @@ def process_week_matchups(
     games_by_user = defaultdict(list)
     all_scores = []
     
-    # Group matchups by matchup_id
-    matchup_groups = group_matchups_by_id(matchups)
-    
-    for matchup_id, matchup_list in matchup_groups.items():
-        if len(matchup_list) == 2:
-            team1 = matchup_list[0]
-            team2 = matchup_list[1]
-            
-            roster_id1 = team1.get('roster_id')
-            roster_id2 = team2.get('roster_id')
-            points1 = team1.get('points', 0.0)
-            points2 = team2.get('points', 0.0)
+    for team1, team2 in iter_matchup_pairs(matchups):
+        roster_id1 = team1.get('roster_id')
+        roster_id2 = team2.get('roster_id')
+        points1 = team1.get('points', 0.0)
+        points2 = team2.get('points', 0.0)
+        
+        if roster_id1 and roster_id2:
+            user_id1 = roster_to_user.get(roster_id1)
+            user_id2 = roster_to_user.get(roster_id2)
             
-            if roster_id1 and roster_id2:
-                user_id1 = roster_to_user.get(roster_id1)
-                user_id2 = roster_to_user.get(roster_id2)
+            if user_id1 and user_id2:
+                all_scores.append(points1)
+                all_scores.append(points2)
                 
-                if user_id1 and user_id2:
-                    all_scores.append(points1)
-                    all_scores.append(points2)
-                    
-                    # Determine winner
-                    won1 = points1 > points2
-                    won2 = points2 > points1
-                    margin1 = points1 - points2
-                    margin2 = points2 - points1
-                    
-                    # Store game data for user1
-                    games_by_user[user_id1].append({
-                        'year': year,
-                        'week': week,
-                        'points': points1,
-                        'opponent_points': points2,
-                        'won': won1,
-                        'margin': margin1,
-                        'opponent_user_id': user_id2
-                    })
-                    
-                    # Store game data for user2
-                    games_by_user[user_id2].append({
-                        'year': year,
-                        'week': week,
-                        'points': points2,
-                        'opponent_points': points1,
-                        'won': won2,
-                        'margin': margin2,
-                        'opponent_user_id': user_id1
-                    })
+                # Determine winner
+                won1 = points1 > points2
+                won2 = points2 > points1
+                margin1 = points1 - points2
+                margin2 = points2 - points1
+                
+                # Store game data for each user
+                games_by_user[user_id1].append(
+                    Game(year, week, points1, points2, won1, margin1, user_id2)
+                )
+                games_by_user[user_id2].append(
+                    Game(year, week, points2, points1, won2, margin2, user_id1)
+                )
     
     # Calculate weekly median
-    weekly_median = statistics.median(all_scores) if all_scores else 0.0
+    weekly_median = sorted_median(sorted(all_scores)) if all_scores else 0.0
     
     return games_by_user, weekly_median
 
 
-def collect_all_season_data(unmunged_dir: Path) -> Tuple[Dict[str, Dict], Dict[str, str]]:
+# Counts tallied once per manager per week by tally_week_luck
+LUCK_FLAGS = ('lucky_wins', 'unlucky_losses', 'top_score_weeks', 'low_score_weeks')
+
+# Per-season counts that collect_all_season_data adds across seasons
+_SEASON_COUNTERS = ('weeks_above_median', 'total_weeks') + LUCK_FLAGS
+
+
+def tally_week_luck(
+    week_scores: List[float],
+    user_results: Dict[str, Tuple[float, bool]],
+    flags_by_user: Dict[str, Dict[str, int]]
+) -> None:
     """
-    Collect all game data across all seasons.
+    Count one week's lucky wins, unlucky losses, and top/low score weeks.
+    
+    Each manager counts once per week. user_results should hold the
+    (points, won) of their last matchup in iter_matchup_pairs order, should
+    they own two rosters.
+    
+    Args:
+        week_scores: Every score of the week (any order, non-empty)
+        user_results: Dict mapping user_id to (points, won)
+        flags_by_user: Dict mapping user_id to counts keyed by LUCK_FLAGS,
+            updated in place (missing users are added)
+    """
+    # One sort gives the median and both extremes
+    ordered = sorted(week_scores)
+    weekly_median = sorted_median(ordered)
+    week_min = ordered[0]
+    week_max = ordered[-1]
+    
+    for user_id, (points, won) in user_results.items():
+        user_flags = flags_by_user.get(user_id)
+        if user_flags is None:
+            user_flags = flags_by_user[user_id] = dict.fromkeys(LUCK_FLAGS, 0)
+        
+        # Lucky win: won but scored below median
+        if won and points < weekly_median:
+            user_flags['lucky_wins'] += 1
+        
+        # Unlucky loss: lost but scored above median
+        if not won and points > weekly_median:
+            user_flags['unlucky_losses'] += 1
+        
+        # Top score week
+        if points == week_max:
+            user_flags['top_score_weeks'] += 1
+        
+        # Low score week
+        if points == week_min:
+            user_flags['low_score_weeks'] += 1
+
+
+def _new_user_stats() -> Dict:
+    """
+    Build an empty per-user stats dictionary.
     
     Returns:
-        Tuple of (stats_by_user, user_id_to_display_name)
-        stats_by_user: Dict mapping user_id to dict of aggregated stats
-        user_id_to_display_name: Dict mapping user_id to display_name
+        Stats dictionary with every counter at zero
     """
-    stats_by_user = defaultdict(lambda: {
+    return {
         'seasons': set(),
-        'games': [],
+        'games': GameLog(),
         'all_scores': [],
         'weeks_above_median': 0,
         'total_weeks': 0,
@@ -102,86 +206,167 @@ def collect_all_season_data(unmunged_dir: Path) -> Tuple[Dict[str, Dict], Dict[s
         'unlucky_losses': 0,
         'top_score_weeks': 0,
         'low_score_weeks': 0
-    })
+    }
+
+
+def _collect_season_data(season_dir: Path) -> Optional[Tuple[Dict[str, Dict], Dict[str, str]]]:
+    """
+    Collect regular-season game data for one season.
+    
+    Besides each manager's games, counts lucky wins, unlucky losses, and
+    top/low score weeks (see tally_week_luck), so every matchups.json is
+    read once. May run in a worker process, so the result uses plain
+    (picklable) dicts.
+    
+    Args:
+        season_dir: Path to season directory (e.g., src/data/unmunged/2024)
+        
+    Returns:
+        Tuple of (stats_by_user, user_id_to_display_name) for this season,
+        or None if the season is missing required files
+    """
+    year = season_dir.name
+    logger.info(f"Processing season {year}...")
+    
+    # Load league info to get playoff week start
+    league_info_path = season_dir / "league_info.json"
+    if not league_info_path.exists():
+        logger.warning(f"  No league_info.json found, skipping")
+        return None
+    
+    league_info = load_json(league_info_path)
+    if league_info is None:
+        return None
+    
+    playoff_week_start = league_info.get('settings', {}).get(
+        'playoff_week_start', DEFAULT_PLAYOFF_WEEK_START
+    )
+    
+    # Load users and rosters
+    users_path = season_dir / "users.json"
+    rosters_path = season_dir / "rosters.json"
+    
+    if not users_path.exists() or not rosters_path.exists():
+        logger.warning(f"  Missing users.json or rosters.json, skipping")
+        return None
+    
+    users_map = load_users_map(users_path)
+    
+    # Map roster_id to user_id (owner_id)
+    roster_to_user = {}
+    rosters_data = load_json(rosters_path)
+    if rosters_data is None:
+        return None
+    
+    stats_by_user = {}
     user_id_to_display_name = {}
     
-    # Get all season directories
-    season_dirs = sorted([
-        item for item in unmunged_dir.iterdir()
-        if item.is_dir() and item.name.isdigit() and (item / "league_info.json").exists()
-    ])
-    
-    for season_dir in season_dirs:
-        year = season_dir.name
-        logger.info(f"Processing season {year}...")
-        
-        # Load league info to get playoff week start
-        league_info_path = season_dir / "league_info.json"
-        if not league_info_path.exists():
-            logger.warning(f"  No league_info.json found, skipping")
+    for roster in rosters_data:
+        roster_id = roster.get('roster_id')
+        owner_id = roster.get('owner_id')
+        if roster_id is not None and owner_id:
+            roster_to_user[roster_id] = owner_id
+            # Store display_name mapping
+            if owner_id in users_map:
+                user_id_to_display_name[owner_id] = users_map[owner_id].get('display_name', owner_id)
+            if owner_id not in stats_by_user:
+                stats_by_user[owner_id] = _new_user_stats()
+            stats_by_user[owner_id]['seasons'].add(year)
+    
+    # Per-week containers, cleared and reused rather than reallocated each week
+    week_scores = []
+    user_results = {}  # user_id -> (points, won)
+    
+    # Process regular season weeks only
+    for week in range(1, playoff_week_start):
+        week_dir = season_dir / f"week_{week}"
+        matchups_path = week_dir / "matchups.json"
+        
+        if not matchups_path.exists():
             continue
         
-        league_info = load_json(league_info_path)
-        if league_info is None:
+        matchups = load_json(matchups_path)
+        if matchups is None:
             continue
         
-        playoff_week_start = league_info.get('settings', {}).get(
-            'playoff_week_start', DEFAULT_PLAYOFF_WEEK_START
+        games_by_user, weekly_median = process_week_matchups(
+            matchups, roster_to_user, year, week
         )
         
-        # Load users and rosters
-        users_path = season_dir / "users.json"
-        rosters_path = season_dir / "rosters.json"
-        
-        if not users_path.exists() or not rosters_path.exists():
-            logger.warning(f"  Missing users.json or rosters.json, skipping")
+        if not games_by_user:
             continue
         
-        users_map = load_users_map(users_path)
-        rosters_map = load_rosters_map(rosters_path, users_map)
+        week_scores.clear()
+        user_results.clear()
         
-        # Map roster_id to user_id (owner_id)
-        roster_to_user = {}
-        rosters_data = load_json(rosters_path)
-        if rosters_data is None:
-            continue
-        
-        for roster in rosters_data:
-            roster_id = roster.get('roster_id')
-            owner_id = roster.get('owner_id')
-            if roster_id is not None and owner_id:
-                roster_to_user[roster_id] = owner_id
-                # Store display_name mapping
-                if owner_id in users_map:
-                    user_id_to_display_name[owner_id] = users_map[owner_id].get('display_name', owner_id)
-                stats_by_user[owner_id]['seasons'].add(year)
-        
-        # Process regular season weeks only
-        for week in range(1, playoff_week_start):
-            week_dir = season_dir / f"week_{week}"
-            matchups_path = week_dir / "matchups.json"
-            
-            if not matchups_path.exists():
-                continue
+        # Update stats for each user, resolving their stats dict once per week
+        for user_id, games in games_by_user.items():
+            user_stats = stats_by_user[user_id]
+            scores = [game.points for game in games]
             
-            matchups = load_json(matchups_path)
-            if matchups is None:
-                continue
+            user_stats['games'].extend(games)
+            user_stats['all_scores'].extend(scores)
+            user_stats['total_weeks'] += len(games)
             
-            games_by_user, weekly_median = process_week_matchups(
-                matchups, roster_to_user, year, week
+            # Count weeks above median for median win %
+            user_stats['weeks_above_median'] += sum(
+                1 for points in scores if points > weekly_median
             )
             
-            # Update stats for each user
-            for user_id, games in games_by_user.items():
-                for game in games:
-                    stats_by_user[user_id]['games'].append(game)
-                    stats_by_user[user_id]['all_scores'].append(game['points'])
-                    stats_by_user[user_id]['total_weeks'] += 1
-                    
-                    # Check if above median for median win %
-                    if game['points'] > weekly_median:
-                        stats_by_user[user_id]['weeks_above_median'] += 1
+            week_scores.extend(scores)
+            # Games are appended pair by pair (first side, then second) in
+            # iter_matchup_pairs order, so the last game is the result a
+            # pair-order walk assigns last, even for both sides of one matchup
+            last_game = games[-1]
+            user_results[user_id] = (last_game.points, last_game.won)
+        
+        # Every manager already has a stats dict holding the luck counters
+        tally_week_luck(week_scores, user_results, stats_by_user)
     
     return stats_by_user, user_id_to_display_name
 
+
+def collect_all_season_data(
+    unmunged_dir: Path,
+    max_workers: Optional[int] = None
+) -> Tuple[Dict[str, Dict], Dict[str, str]]:
+    """
+    Collect all game data across all seasons.
+    
+    Seasons are independent, so large histories are collected in parallel
+    (see map_seasons) and the partial results are merged in season order.
+    
+    Args:
+        unmunged_dir: Path to unmunged directory (e.g., src/data/unmunged)
+        max_workers: Maximum worker processes (default: one per CPU)
+    
+    Returns:
+        Tuple of (stats_by_user, user_id_to_display_name)
+        stats_by_user: Dict mapping user_id to dict of aggregated stats
+        user_id_to_display_name: Dict mapping user_id to display_name
+    """
+    stats_by_user = defaultdict(_new_user_stats)
+    user_id_to_display_name = {}
+    
+    # Get all season directories
+    season_dirs = get_season_directories(unmunged_dir, newest_first=False)
+    
+    season_results = map_seasons(_collect_season_data, season_dirs, max_workers)
+    
+    # Merge in season order so games and display names match a sequential walk
+    for season_result in season_results:
+        if season_result is None:
+            continue
+        
+        season_stats, season_names = season_result
+        user_id_to_display_name.update(season_names)
+        
+        for user_id, partial in season_stats.items():
+            user_stats = stats_by_user[user_id]
+            user_stats['seasons'] |= partial['seasons']
+            user_stats['games'].merge(partial['games'])
+            user_stats['all_scores'].extend(partial['all_scores'])
+            for counter in _SEASON_COUNTERS:
+                user_stats[counter] += partial[counter]
+    
+    return stats_by_user, user_id_to_display_name
@@ -1,5 +1,6 @@
 """Head-to-head record building functions."""
-from collections import defaultdict
+from collections import Counter
+from itertools import compress, repeat
 from typing import Dict, Tuple
 
 
@@ -11,24 +12,26 @@ def build_head_to_head_records(stats_by_user: Dict[str, Dict]) -> Dict[str, Dict
         Dict mapping user_id1 to dict mapping user_id2 to (wins, losses) tuple
         where wins is user_id1's wins against user_id2
     """
-    h2h_records = defaultdict(lambda: defaultdict(lambda: [0, 0]))  # [wins, losses]
+    # Flat counters keyed by (user_id, opponent_id), filled a whole GameLog at a
+    # time: Counter.update counts an iterable of keys in C (a groupby-count)
+    games_played = Counter()
+    wins = Counter()
     
     for user_id, user_data in stats_by_user.items():
-        for game in user_data.get('games', []):
-            opponent_id = game.get('opponent_user_id')
-            if opponent_id:
-                if game.get('won'):
-                    h2h_records[user_id][opponent_id][0] += 1  # win
-                else:
-                    h2h_records[user_id][opponent_id][1] += 1  # loss
+        games = user_data.get('games')
+        if not games:
+            continue
+        
+        # process_week_matchups only records games between two known managers,
+        # so every opponent id is set
+        pairings = list(zip(repeat(user_id), games.opponent_user_id))
+        games_played.update(pairings)
+        wins.update(compress(pairings, games.won))
     
-    # Convert to tuples
+    # Nest into user_id -> opponent_id -> (wins, losses)
     result = {}
-    for user_id, opponents in h2h_records.items():
-        result[user_id] = {
-            opp_id: (wins, losses)
-            for opp_id, (wins, losses) in opponents.items()
-        }
+    for (user_id, opp_id), game_count in games_played.items():
+        win_count = wins[(user_id, opp_id)]
+        result.setdefault(user_id, {})[opp_id] = (win_count, game_count - win_count)
     
     return result
-
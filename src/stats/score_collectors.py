@@ -1,213 +1,195 @@
 """Score collection functions for high scores."""
+from functools import partial
+from heapq import nlargest
+from itertools import chain, groupby
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-from utils.json_utils import load_json
+from utils.file_utils import list_recap_paths
+from utils.json_utils import parse_json
 from utils.logging_utils import get_logger
+from utils.parallel_utils import map_seasons
 
 logger = get_logger('stats.score_collectors')
 
+_get_year = itemgetter(0)
+_get_points = attrgetter('points')
 
-def collect_weekly_high_scores(munged_dir: Path) -> List[Dict]:
+
+class WeeklyScore(NamedTuple):
+    """One team's score for one week."""
+    points: float
+    year: str
+    week: int
+    team_name: str
+
+
+class PlayerScore(NamedTuple):
+    """One player's score for one week (starters and bench)."""
+    points: float
+    year: str
+    week: int
+    player_name: str
+    team_name: str
+
+
+def _emit_from_matchups(
+    matchups: List[Dict],
+    year: str,
+    week: int,
+    weekly_scores: List[WeeklyScore],
+    player_scores: List[PlayerScore]
+) -> None:
     """
-    Collect all weekly team scores across all seasons (regular season and postseason).
+    Append one week's team and player scores from its recap matchups.
     
-    Returns:
-        List of dicts with keys: points, year, week, team_name
+    Args:
+        matchups: Matchups list from a recap.json
+        year: Season year
+        week: Week number
+        weekly_scores: Team score list to append to
+        player_scores: Player score list to append to
     """
-    weekly_scores = []
-    
-    # Get all season directories
-    season_dirs = sorted([
-        item for item in munged_dir.iterdir()
-        if item.is_dir() and item.name.isdigit()
-    ])
+    # One tuple per player (no per-score dict), appended through local aliases
+    add_weekly = weekly_scores.append
+    add_player = player_scores.append
     
-    for season_dir in season_dirs:
-        year = season_dir.name
+    for matchup in matchups:
+        team_name = matchup.get('team_name', 'Unknown')
         
-        # Process regular season weeks
-        regular_season_dir = season_dir / "regular_season"
-        if regular_season_dir.exists():
-            for week_dir in sorted(regular_season_dir.iterdir()):
-                if not week_dir.is_dir() or not week_dir.name.startswith("week_"):
-                    continue
-                
-                recap_path = week_dir / "recap.json"
-                if not recap_path.exists():
-                    continue
-                
-                try:
-                    recap_data = load_json(recap_path)
-                    if recap_data is None:
-                        continue
-                    
-                    matchups = recap_data.get('matchups', [])
-                    for matchup in matchups:
-                        points = matchup.get('points', 0.0)
-                        team_name = matchup.get('team_name', 'Unknown')
-                        week_num = int(week_dir.name.replace('week_', ''))
-                        
-                        weekly_scores.append({
-                            'points': points,
-                            'year': year,
-                            'week': week_num,
-                            'team_name': team_name
-                        })
-                except Exception as e:
-                    logger.error(f"  Error processing {recap_path}: {e}")
-                    continue
+        add_weekly(WeeklyScore(matchup.get('points', 0.0), year, week, team_name))
         
-        # Process postseason weeks
-        postseason_dir = season_dir / "postseason"
-        if postseason_dir.exists():
-            # Process week_N_recap.json files
-            for recap_file in sorted(postseason_dir.glob("week_*_recap.json")):
-                try:
-                    # Extract week number from filename (e.g., "week_15_recap.json" -> 15)
-                    week_str = recap_file.stem.replace('week_', '').replace('_recap', '')
-                    week_num = int(week_str)
-                    
-                    recap_data = load_json(recap_file)
-                    if recap_data is None:
-                        continue
-                    
-                    matchups = recap_data.get('matchups', [])
-                    for matchup in matchups:
-                        points = matchup.get('points', 0.0)
-                        team_name = matchup.get('team_name', 'Unknown')
-                        
-                        weekly_scores.append({
-                            'points': points,
-                            'year': year,
-                            'week': week_num,
-                            'team_name': team_name
-                        })
-                except Exception as e:
-                    logger.error(f"  Error processing {recap_file}: {e}")
-                    continue
+        # Starters, then bench players
+        for players in (matchup.get('starters', []), matchup.get('bench', [])):
+            for player in players:
+                add_player(PlayerScore(
+                    player.get('points', 0.0),
+                    year,
+                    week,
+                    player.get('player_name', 'Unknown'),
+                    team_name
+                ))
+
+
+def _keep_top_scores(scores: List, top_n: Optional[int]) -> None:
+    """
+    Trim a score list in place to its top_n highest scores.
+    
+    nlargest is stable, so equal scores keep their collection order and the
+    result matches sorting the untrimmed list and slicing.
     
-    return weekly_scores
+    Args:
+        scores: WeeklyScore or PlayerScore list to trim
+        top_n: Number of scores to keep (None keeps every score)
+    """
+    if top_n is not None and len(scores) > top_n:
+        scores[:] = nlargest(top_n, scores, key=_get_points)
+
+
+def _read_recap(recap_path: Path) -> Optional[bytes]:
+    """Read a recap file's bytes, or None if it doesn't exist."""
+    try:
+        return recap_path.read_bytes()
+    except FileNotFoundError:
+        return None
 
 
-def collect_player_high_scores(munged_dir: Path) -> List[Dict]:
+def _collect_season_scores(
+    season_recaps: List[Tuple[str, int, Path]],
+    top_n: Optional[int] = None
+) -> Tuple[List[WeeklyScore], List[PlayerScore]]:
     """
-    Collect all individual player scores across all seasons (regular season and postseason).
+    Collect team and player scores for one season (regular season and postseason).
+    
+    Each recap.json is read once for both lists. May run in a worker process,
+    one season per task.
     
+    Args:
+        season_recaps: One season's (year, week, recap_path) tuples from list_recap_paths
+        top_n: Keep only this many of the highest team and player scores,
+            trimming after every week (None keeps every score)
+        
     Returns:
-        List of dicts with keys: points, year, week, player_name, team_name
+        Tuple of (weekly_scores, player_scores) for this season
     """
+    weekly_scores = []
     player_scores = []
     
-    # Get all season directories
-    season_dirs = sorted([
-        item for item in munged_dir.iterdir()
-        if item.is_dir() and item.name.isdigit()
-    ])
+    for year, week_num, recap_path in season_recaps:
+        try:
+            # None for a week without a recap
+            recap_bytes = _read_recap(recap_path)
+            if recap_bytes is None:
+                continue
+            
+            recap_data = parse_json(recap_bytes)
+            _emit_from_matchups(
+                recap_data.get('matchups', []), year, week_num, weekly_scores, player_scores
+            )
+            _keep_top_scores(weekly_scores, top_n)
+            _keep_top_scores(player_scores, top_n)
+        except Exception as e:
+            logger.error("  Error processing %s: %s", recap_path, e)
+            continue
     
-    for season_dir in season_dirs:
-        year = season_dir.name
-        
-        # Process regular season weeks
-        regular_season_dir = season_dir / "regular_season"
-        if regular_season_dir.exists():
-            for week_dir in sorted(regular_season_dir.iterdir()):
-                if not week_dir.is_dir() or not week_dir.name.startswith("week_"):
-                    continue
-                
-                recap_path = week_dir / "recap.json"
-                if not recap_path.exists():
-                    continue
-                
-                try:
-                    recap_data = load_json(recap_path)
-                    if recap_data is None:
-                        continue
-                    
-                    matchups = recap_data.get('matchups', [])
-                    for matchup in matchups:
-                        team_name = matchup.get('team_name', 'Unknown')
-                        week_num = int(week_dir.name.replace('week_', ''))
-                        
-                        # Process starters
-                        starters = matchup.get('starters', [])
-                        for player in starters:
-                            points = player.get('points', 0.0)
-                            player_name = player.get('player_name', 'Unknown')
-                            
-                            player_scores.append({
-                                'points': points,
-                                'year': year,
-                                'week': week_num,
-                                'player_name': player_name,
-                                'team_name': team_name
-                            })
-                        
-                        # Process bench players
-                        bench = matchup.get('bench', [])
-                        for player in bench:
-                            points = player.get('points', 0.0)
-                            player_name = player.get('player_name', 'Unknown')
-                            
-                            player_scores.append({
-                                'points': points,
-                                'year': year,
-                                'week': week_num,
-                                'player_name': player_name,
-                                'team_name': team_name
-                            })
-                except Exception as e:
-                    logger.error(f"  Error processing {recap_path}: {e}")
-                    continue
+    return weekly_scores, player_scores
+
+
+def collect_high_scores(
+    munged_dir: Path,
+    top_n: Optional[int] = None
+) -> Tuple[List[WeeklyScore], List[PlayerScore]]:
+    """
+    Collect all weekly team scores and individual player scores in one pass.
+    
+    The recap paths are enumerated once (see list_recap_paths). Seasons are
+    independent, so large histories are decoded in parallel (see
+    map_seasons); results keep season order.
+    
+    Args:
+        munged_dir: Path to munged directory (e.g., src/data/munged)
+        top_n: Keep only this many of the highest team and player scores,
+            highest first (None keeps every score, in collection order)
         
-        # Process postseason weeks
-        postseason_dir = season_dir / "postseason"
-        if postseason_dir.exists():
-            # Process week_N_recap.json files
-            for recap_file in sorted(postseason_dir.glob("week_*_recap.json")):
-                try:
-                    # Extract week number from filename (e.g., "week_15_recap.json" -> 15)
-                    week_str = recap_file.stem.replace('week_', '').replace('_recap', '')
-                    week_num = int(week_str)
-                    
-                    recap_data = load_json(recap_file)
-                    if recap_data is None:
-                        continue
-                    
-                    matchups = recap_data.get('matchups', [])
-                    for matchup in matchups:
-                        team_name = matchup.get('team_name', 'Unknown')
-                        
-                        # Process starters
-                        starters = matchup.get('starters', [])
-                        for player in starters:
-                            points = player.get('points', 0.0)
-                            player_name = player.get('player_name', 'Unknown')
-                            
-                            player_scores.append({
-                                'points': points,
-                                'year': year,
-                                'week': week_num,
-                                'player_name': player_name,
-                                'team_name': team_name
-                            })
-                        
-                        # Process bench players
-                        bench = matchup.get('bench', [])
-                        for player in bench:
-                            points = player.get('points', 0.0)
-                            player_name = player.get('player_name', 'Unknown')
-                            
-                            player_scores.append({
-                                'points': points,
-                                'year': year,
-                                'week': week_num,
-                                'player_name': player_name,
-                                'team_name': team_name
-                            })
-                except Exception as e:
-                    logger.error(f"  Error processing {recap_file}: {e}")
-                    continue
+    Returns:
+        Tuple of (weekly_scores, player_scores)
+        weekly_scores: List of WeeklyScore tuples
+        player_scores: List of PlayerScore tuples
+    """
+    # The listing is ordered by season, so groupby yields one group per season
+    season_recaps = [
+        list(recaps) for _, recaps in groupby(list_recap_paths(munged_dir), key=_get_year)
+    ]
+    season_results = map_seasons(partial(_collect_season_scores, top_n=top_n), season_recaps)
+    
+    weekly_scores = list(chain.from_iterable(weekly for weekly, _ in season_results))
+    player_scores = list(chain.from_iterable(players for _, players in season_results))
     
-    return player_scores
+    if top_n is not None:
+        # Each season kept its own top_n, so the overall top_n is among them
+        weekly_scores = nlargest(top_n, weekly_scores, key=_get_points)
+        player_scores = nlargest(top_n, player_scores, key=_get_points)
+    return weekly_scores, player_scores
+
 
+def collect_weekly_high_scores(munged_dir: Path, top_n: Optional[int] = None) -> List[WeeklyScore]:
+    """
+    Collect all weekly team scores across all seasons (regular season and postseason).
+    
+    Returns:
+        List of WeeklyScore tuples (points, year, week, team_name), limited to
+        the top_n highest when top_n is given
+    """
+    return collect_high_scores(munged_dir, top_n)[0]
+
+
+def collect_player_high_scores(munged_dir: Path, top_n: Optional[int] = None) -> List[PlayerScore]:
+    """
+    Collect all individual player scores across all seasons (regular season and postseason).
+    
+    Returns:
+        List of PlayerScore tuples (points, year, week, player_name, team_name),
+        limited to the top_n highest when top_n is given
+    """
+    return collect_high_scores(munged_dir, top_n)[1]
@@ -1,9 +1,10 @@
 """Utility functions for common operations."""
 
-from .matchup_utils import group_matchups_by_id
-from .json_utils import load_json, save_json
+from .matchup_utils import group_matchups_by_id, iter_matchup_pairs
+from .json_utils import load_json, load_json_cached, parse_json, save_json
 from .file_utils import ensure_directory
 from .logging_utils import setup_logging, get_logger
+from .parallel_utils import map_seasons
 from .exceptions import (
     NuChoateLeagueError,
     APIError,
@@ -21,11 +22,15 @@ from .validation import (
 
 __all__ = [
     'group_matchups_by_id',
+    'iter_matchup_pairs',
     'load_json',
+    'load_json_cached',
+    'parse_json',
     'save_json',
     'ensure_directory',
     'setup_logging',
     'get_logger',
+    'map_seasons',
     'NuChoateLeagueError',
     'APIError',
     'DataValidationError',
@@ -1,6 +1,17 @@
 """Utility functions for file operations."""
+import os
+import tempfile
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import List
+from typing import Iterable, List, Optional, Tuple
+
+_entry_name = attrgetter('name')
+
+# Process umask, read once at import (os.umask can only be read by setting
+# it) so atomically written files get the same mode a plain open() would give
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
 
 def ensure_directory(dir_path: Path) -> Path:
@@ -20,25 +31,233 @@ def ensure_directory(dir_path: Path) -> Path:
     return dir_path
 
 
-def get_season_directories(base_dir: Path) -> List[Path]:
+def is_up_to_date(output_path: Path, *input_paths: Path) -> bool:
+    """
+    Check whether an output file is newer than all of its inputs.
+
+    A missing input counts as a change: the output may still show data from a
+    file that has since been deleted, so it is rebuilt.
+
+    Args:
+        output_path: Path to generated output file
+        *input_paths: Paths the output was generated from
+
+    Returns:
+        True if output and every input exist and output's mtime is >= every input's mtime
+    """
+    try:
+        output_mtime = output_path.stat().st_mtime
+        for input_path in input_paths:
+            if input_path.stat().st_mtime > output_mtime:
+                return False
+    except FileNotFoundError:
+        return False
+
+    return True
+
+
+def write_text_atomic(
+    output_path: Path,
+    parts: Iterable[str],
+    newline: Optional[str] = None
+) -> None:
+    """
+    Write text to a file atomically via a temporary file and os.replace.
+    
+    Readers see either the previous file or the complete new one, never a
+    partially written page. The temporary file has a unique name in the
+    output directory, so concurrent builds never share one. No fsync is done
+    per file; call flush_reports_dir once after a batch of writes for
+    durability.
+    
+    Args:
+        output_path: Path to output file
+        parts: Text fragments to write, in order
+        newline: Newline translation, as for open() (use '' for CSV text)
+        
+    Raises:
+        OSError: If the file cannot be written
+    """
+    with tempfile.NamedTemporaryFile(
+        'w',
+        encoding='utf-8',
+        newline=newline,
+        buffering=65536,
+        dir=output_path.parent,
+        prefix=output_path.name + '.',
+        suffix='.tmp',
+        delete=False
+    ) as f:
+        tmp_path = Path(f.name)
+        try:
+            f.writelines(parts)
+        except BaseException:
+            f.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
+    try:
+        # NamedTemporaryFile creates files as 0600
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def flush_reports_dir(dir_path: Path) -> None:
+    """
+    Fsync a directory so renames into it are durable.
+    
+    Args:
+        dir_path: Directory to flush
+        
+    Raises:
+        OSError: If the directory cannot be opened or synced
+    """
+    fd = os.open(dir_path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def get_week_numbers(season_phase_dir: Path) -> List[int]:
+    """
+    Get the week numbers of all week_N directories in a season phase directory.
+    
+    Uses os.scandir so directory checks come from the cached dirent type
+    instead of a stat call per entry.
+    
+    Args:
+        season_phase_dir: Directory containing week_N folders (e.g., regular_season)
+        
+    Returns:
+        Sorted list of week numbers (empty if the directory doesn't exist)
+    """
+    weeks = []
+    try:
+        with os.scandir(season_phase_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('week_') and entry.is_dir(follow_symlinks=False):
+                    try:
+                        weeks.append(int(entry.name[5:]))
+                    except ValueError:
+                        continue
+    except FileNotFoundError:
+        pass
+    
+    weeks.sort()
+    return weeks
+
+
+def get_season_directories(base_dir: Path, newest_first: bool = True) -> List[Path]:
     """
     Get all valid season directories from a base directory.
     
     Args:
         base_dir: Base directory containing season folders
+        newest_first: Sort newest season first (default) instead of oldest first
         
     Returns:
         List of Path objects for valid season directories (sorted)
     """
-    if not base_dir.exists():
+    try:
+        # scandir entries carry their type, so is_dir() needs no extra stat call
+        with os.scandir(base_dir) as entries:
+            season_dirs = [
+                Path(entry.path) for entry in entries
+                if entry.name.isdigit() and entry.is_dir()
+                # Check if it has league_info.json to confirm it's a valid season
+                and os.path.exists(os.path.join(entry.path, "league_info.json"))
+            ]
+    except FileNotFoundError:
         return []
     
-    season_dirs = []
-    for item in base_dir.iterdir():
-        if item.is_dir() and item.name.isdigit():
-            # Check if it has league_info.json to confirm it's a valid season
-            if (item / "league_info.json").exists():
-                season_dirs.append(item)
+    return sorted(season_dirs, reverse=newest_first)
+
+
+def _mtime_ns(dir_path: str) -> Optional[int]:
+    """Return a directory's mtime in nanoseconds, or None if it doesn't exist."""
+    try:
+        return os.stat(dir_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=4)
+def _list_recap_paths(
+    munged_dir: str,
+    tree_signature: Tuple[Tuple[str, Optional[int], Optional[int]], ...]
+) -> Tuple[Tuple[str, int, Path], ...]:
+    """
+    Enumerate recap paths for the seasons named in tree_signature.
+    
+    Cached on the phase directory mtimes in tree_signature, which change
+    whenever a week directory or postseason recap is added or removed.
+    """
+    recap_paths = []
+    
+    for year, regular_mtime, postseason_mtime in tree_signature:
+        season_dir = Path(munged_dir) / year
+        
+        # Regular season: week_N/recap.json (missing recaps are left to the reader)
+        if regular_mtime is not None:
+            with os.scandir(season_dir / "regular_season") as entries:
+                week_entries = sorted(
+                    (entry for entry in entries if entry.name.startswith("week_") and entry.is_dir()),
+                    key=_entry_name
+                )
+            for week_entry in week_entries:
+                try:
+                    week = int(week_entry.name[5:])
+                except ValueError:
+                    continue
+                recap_paths.append((year, week, Path(week_entry.path) / "recap.json"))
+        
+        # Postseason: week_N_recap.json files
+        if postseason_mtime is not None:
+            for recap_file in sorted((season_dir / "postseason").glob("week_*_recap.json")):
+                try:
+                    week = int(recap_file.stem[5:-6])
+                except ValueError:
+                    continue
+                recap_paths.append((year, week, recap_file))
     
-    return sorted(season_dirs, reverse=True)
+    return tuple(recap_paths)
+
 
+def list_recap_paths(munged_dir: Path) -> List[Tuple[str, int, Path]]:
+    """
+    List every weekly recap path in a munged tree, oldest season first.
+    
+    Each season lists its regular-season week_N/recap.json paths (sorted by
+    directory name), then its postseason week_N_recap.json files. The
+    listing is cached per tree and reused until a season or phase directory
+    changes.
+    
+    Args:
+        munged_dir: Path to munged directory (e.g., src/data/munged)
+        
+    Returns:
+        List of (year, week, recap_path) tuples (empty if the directory doesn't exist)
+    """
+    try:
+        with os.scandir(munged_dir) as entries:
+            years = sorted(
+                entry.name for entry in entries
+                if entry.name.isdigit() and entry.is_dir()
+            )
+    except FileNotFoundError:
+        return []
+    
+    # Two stats per season decide whether the cached listing is still current
+    tree_signature = tuple(
+        (
+            year,
+            _mtime_ns(os.path.join(munged_dir, year, "regular_season")),
+            _mtime_ns(os.path.join(munged_dir, year, "postseason"))
+        )
+        for year in years
+    )
+    return list(_list_recap_paths(str(munged_dir), tree_signature))
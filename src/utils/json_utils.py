@@ -1,8 +1,15 @@
 """Utility functions for JSON operations."""
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+# orjson parses several times faster than the stdlib; it is optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def load_json(file_path: Path) -> Optional[Dict]:
     """
@@ -18,16 +25,86 @@ def load_json(file_path: Path) -> Optional[Dict]:
         json.JSONDecodeError: If JSON is invalid
         IOError: If file cannot be read
     """
-    if not file_path.exists():
-        return None
-    
+    # Open directly and treat a missing file as None, rather than paying an
+    # extra stat for an exists() check before every read
     try:
+        if orjson is not None:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            return orjson.loads(file_path.read_bytes())
         with open(file_path, 'r', encoding='utf-8') as f:
             return json.load(f)
+    except FileNotFoundError:
+        return None
     except (json.JSONDecodeError, IOError) as e:
         raise e
 
 
+def parse_json(data: bytes) -> Any:
+    """
+    Parse JSON from raw file bytes (UTF-8).
+    
+    Args:
+        data: Encoded JSON document, e.g. from Path.read_bytes()
+        
+    Returns:
+        Parsed JSON data
+        
+    Raises:
+        json.JSONDecodeError: If JSON is invalid
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=512)
+def _read_json_bytes_cached(path_str: str, mtime_ns: int, size: int) -> Optional[bytes]:
+    """
+    Read a JSON file's raw bytes once per (path, mtime, size) version.
+    
+    Only immutable bytes are cached, so no parsed object is ever shared
+    between callers.
+    
+    Args:
+        path_str: Path to JSON file, as a string
+        mtime_ns: File modification time, so an updated file misses the cache
+        size: File size, as a second staleness check
+        
+    Returns:
+        File contents, or None if the file disappeared after the stat
+    """
+    try:
+        return Path(path_str).read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def load_json_cached(file_path: Path) -> Optional[Any]:
+    """
+    Load JSON data from a file, reusing the read if the file is unchanged.
+    
+    The file's bytes are cached and parsed on every call, so each caller gets
+    its own object and may modify it freely.
+    
+    Args:
+        file_path: Path to JSON file
+        
+    Returns:
+        Loaded JSON data, or None if file doesn't exist
+        
+    Raises:
+        json.JSONDecodeError: If JSON is invalid
+    """
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        return None
+    data = _read_json_bytes_cached(str(file_path), st.st_mtime_ns, st.st_size)
+    if data is None:
+        return None
+    return parse_json(data)
+
+
 def save_json(data: Any, output_path: Path, indent: int = 2) -> None:
     """
     Save data to a JSON file.
@@ -41,6 +118,8 @@ def save_json(data: Any, output_path: Path, indent: int = 2) -> None:
         IOError: If file cannot be written
         TypeError: If data is not JSON serializable
     """
+    # Persisted files always go through json.dump so their formatting does not
+    # depend on which optional packages are installed (orjson is read-only here)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=indent, ensure_ascii=False)
@@ -1,6 +1,9 @@
 """Utility functions for matchup processing."""
 from collections import defaultdict
-from typing import Dict, List
+from operator import itemgetter
+from typing import Dict, Iterator, List, Tuple
+
+_get_matchup_id = itemgetter('matchup_id')
 
 
 def group_matchups_by_id(matchups: List[Dict]) -> Dict[int, List[Dict]]:
@@ -20,3 +23,31 @@ def group_matchups_by_id(matchups: List[Dict]) -> Dict[int, List[Dict]]:
             matchup_groups[matchup_id].append(matchup)
     return matchup_groups
 
+
+
+def iter_matchup_pairs(matchups: List[Dict]) -> Iterator[Tuple[Dict, Dict]]:
+    """
+    Yield the two sides of each head-to-head matchup.
+    
+    Sorts by matchup_id and scans adjacent entries instead of building a dict
+    of lists. Only ids with exactly two entries are yielded (as with
+    group_matchups_by_id, where callers skip other group sizes), in ascending
+    matchup_id order with each pair in its original input order.
+    
+    Args:
+        matchups: List of matchup dictionaries
+        
+    Yields:
+        (team1, team2) matchup dictionaries sharing a matchup_id
+    """
+    paired = sorted((m for m in matchups if m.get('matchup_id')), key=_get_matchup_id)
+    n = len(paired)
+    i = 0
+    while i < n:
+        matchup_id = paired[i]['matchup_id']
+        j = i + 1
+        while j < n and paired[j]['matchup_id'] == matchup_id:
+            j += 1
+        if j - i == 2:
+            yield paired[i], paired[i + 1]
+        i = j
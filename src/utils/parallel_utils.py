@@ -0,0 +1,61 @@
+"""Parallel processing utility functions."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+from .logging_utils import get_logger, setup_logging
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Below this many seasons, starting worker processes (a fresh interpreter
+# each on spawn platforms) costs more than reading the seasons serially
+_MIN_PARALLEL_SEASONS = 8
+
+
+def _init_worker_logging(level: int, configured: bool) -> None:
+    """
+    Configure league logging in a worker process.
+    
+    Forked workers inherit the parent's handlers; spawned workers start with
+    none, so their messages would be lost without this.
+    
+    Args:
+        level: Parent's effective league logging level
+        configured: Whether the parent had league logging handlers set up
+    """
+    if configured and not get_logger().handlers:
+        setup_logging(level)
+
+
+def map_seasons(
+    func: Callable[[T], R],
+    seasons: Sequence[T],
+    max_workers: Optional[int] = None
+) -> List[R]:
+    """
+    Apply a function to every season, keeping season order.
+    
+    Seasons are independent, so with enough of them each one runs in its own
+    worker process (never more workers than seasons); otherwise they run
+    serially in this process. func and every season must be picklable.
+    
+    Args:
+        func: Module-level function taking one season
+        seasons: Season items to process
+        max_workers: Maximum worker processes (default: one per CPU)
+    
+    Returns:
+        List of func results, in the same order as seasons
+    """
+    workers = min(len(seasons), max_workers or os.cpu_count() or 1)
+    if len(seasons) < _MIN_PARALLEL_SEASONS or workers < 2:
+        return [func(season) for season in seasons]
+    
+    league_logger = get_logger()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker_logging,
+        initargs=(league_logger.getEffectiveLevel(), bool(league_logger.handlers))
+    ) as executor:
+        return list(executor.map(func, seasons))